@@ -3,16 +3,101 @@ Configuration management for PlexCache.
 Handles loading, validation, and management of application settings.
 """
 
+import copy
 import json
 import os
 import logging
+from functools import cached_property, lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder
+    orjson = None
 
 # Get the directory where config.py is located
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 
+# Required settings keys per section, fetched in one call by the section loaders
+_PLEX_KEYS = ('PLEX_URL', 'PLEX_TOKEN', 'number_episodes', 'valid_sections', 'days_to_monitor', 'users_toggle')
+_CACHE_KEYS = ('watchlist_toggle', 'watchlist_episodes', 'watchlist_cache_expiry', 'watched_cache_expiry', 'watched_move')
+_PATH_KEYS = ('plex_source', 'real_source', 'cache_dir', 'nas_library_folders', 'plex_library_folders')
+_PERFORMANCE_KEYS = ('max_concurrent_moves_array', 'max_concurrent_moves_cache')
+
+_get_plex_settings = itemgetter(*_PLEX_KEYS)
+_get_cache_settings = itemgetter(*_CACHE_KEYS)
+_get_path_settings = itemgetter(*_PATH_KEYS)
+_get_performance_settings = itemgetter(*_PERFORMANCE_KEYS)
+
+_REQUIRED_FIELDS = frozenset(chain(_PLEX_KEYS, _CACHE_KEYS, _PATH_KEYS, _PERFORMANCE_KEYS))
+
+# Validation rules, built once at import and reused by every load
+_TYPE_CHECKS = {
+    'PLEX_URL': str,
+    'PLEX_TOKEN': str,
+    'number_episodes': int,
+    'valid_sections': list,
+    'days_to_monitor': int,
+    'users_toggle': bool,
+    'watchlist_toggle': bool,
+    'watchlist_episodes': int,
+    'watchlist_cache_expiry': int,
+    'watched_cache_expiry': int,
+    'watched_move': bool,
+    'plex_source': str,
+    'cache_dir': str,
+    'real_source': str,
+    'nas_library_folders': list,
+    'plex_library_folders': list,
+    'max_concurrent_moves_array': int,
+    'max_concurrent_moves_cache': int,
+}
+_NON_EMPTY_FIELDS = ('plex_source', 'real_source', 'cache_dir', 'PLEX_URL', 'PLEX_TOKEN')
+_NON_NEGATIVE_INT_FIELDS = (
+    'number_episodes', 'days_to_monitor', 'watchlist_episodes',
+    'watchlist_cache_expiry', 'watched_cache_expiry',
+    'max_concurrent_moves_array', 'max_concurrent_moves_cache'
+)
+
+# Settings that are read once for migration purposes and then dropped from the file
+_DEPRECATED_KEYS = frozenset({'firststart', 'skip', 'unraid', 'skip_users'})
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the 4-space layout of existing settings files."""
+    # orjson only supports 2-space indents, so writes stay on the stdlib to keep user files unchanged
+    return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=8)
+def _parse_settings_file(path: str, mtime_ns: int, size: int) -> Tuple[bytes, Dict[str, Any]]:
+    """Read and parse a settings file, returning the raw bytes and the parsed data.
+
+    Keyed on the file's (path, mtime, size) fingerprint so an unchanged file
+    is only parsed once per process. Callers must copy the result before mutating it.
+    """
+    # Unbuffered read sized from the stat the caller already took, skipping TextIO decoding
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        raw = os.read(fd, size)
+        # Pick up anything written after the stat so a short read never truncates the JSON
+        while chunk := os.read(fd, 65536):
+            raw += chunk
+    finally:
+        os.close(fd)
+    return raw, _json_loads(raw)
+
 
 @dataclass
 class NotificationConfig:
@@ -21,11 +106,7 @@ class NotificationConfig:
     unraid_level: str = "summary"
     webhook_level: str = ""
     webhook_url: str = ""
-    webhook_headers: Optional[Dict[str, str]] = None
-
-    def __post_init__(self):
-        if self.webhook_headers is None:
-            self.webhook_headers = {}
+    webhook_headers: Dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -36,14 +117,8 @@ class PathConfig:
     plex_source: str = ""
     real_source: str = ""
     cache_dir: str = ""
-    nas_library_folders: Optional[List[str]] = None
-    plex_library_folders: Optional[List[str]] = None
-
-    def __post_init__(self):
-        if self.nas_library_folders is None:
-            self.nas_library_folders = []
-        if self.plex_library_folders is None:
-            self.plex_library_folders = []
+    nas_library_folders: List[str] = field(default_factory=list)
+    plex_library_folders: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -51,20 +126,12 @@ class PlexConfig:
     """Configuration for Plex server settings."""
     plex_url: str = ""
     plex_token: str = ""
-    valid_sections: Optional[List[int]] = None
+    valid_sections: List[int] = field(default_factory=list)
     number_episodes: int = 10
     days_to_monitor: int = 183
     users_toggle: bool = True
-    skip_ondeck: Optional[List[str]] = None
-    skip_watchlist: Optional[List[str]] = None
-
-    def __post_init__(self):
-        if self.valid_sections is None:
-            self.valid_sections = []
-        if self.skip_ondeck is None:
-            self.skip_ondeck = []
-        if self.skip_watchlist is None:
-            self.skip_watchlist = []
+    skip_ondeck: List[str] = field(default_factory=list)
+    skip_watchlist: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -105,18 +172,22 @@ class ConfigManager:
         self.performance = PerformanceConfig()
         self.debug = False
         self.exit_if_active_session = False
+        self._original_bytes: Optional[bytes] = None
         
     def load_config(self) -> None:
         """Load configuration from file and validate."""
         logging.info(f"Loading configuration from: {self.config_file}")
         
-        if not self.config_file.exists():
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             logging.error(f"Settings file not found: {self.config_file}")
             raise FileNotFoundError(f"Settings file not found: {self.config_file}")
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.settings_data = json.load(f)
+            raw, parsed = _parse_settings_file(str(self.config_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            self._original_bytes = raw
+            self.settings_data = copy.deepcopy(parsed)
             logging.debug("Configuration file loaded successfully")
         except json.JSONDecodeError as e:
             logging.error(f"Invalid JSON in settings file: {type(e).__name__}: {e}")
@@ -133,15 +204,11 @@ class ConfigManager:
     
     def _process_first_start(self) -> None:
         """Handle first start configuration."""
-        firststart = self.settings_data.get('firststart')
-        if firststart:
+        if self.settings_data.get('firststart'):
             self.debug = True
             logging.warning("First start is set to true, setting debug mode temporarily to true.")
-            del self.settings_data['firststart']
         else:
             self.debug = self.settings_data.get('debug', False)
-            if firststart is not None:
-                del self.settings_data['firststart']
     
     def _load_all_configs(self) -> None:
         """Load all configuration sections."""
@@ -150,33 +217,28 @@ class ConfigManager:
         self._load_path_config()
         self._load_performance_config()
         self._load_misc_config()
+        self._prune_deprecated_keys()
     
     def _load_plex_config(self) -> None:
         """Load Plex-related configuration."""
-        self.plex.plex_url = self.settings_data['PLEX_URL']
-        self.plex.plex_token = self.settings_data['PLEX_TOKEN']
-        self.plex.number_episodes = self.settings_data['number_episodes']
-        self.plex.valid_sections = self.settings_data['valid_sections']
-        self.plex.days_to_monitor = self.settings_data['days_to_monitor']
-        self.plex.users_toggle = self.settings_data['users_toggle']
+        (self.plex.plex_url, self.plex.plex_token, self.plex.number_episodes,
+         self.plex.valid_sections, self.plex.days_to_monitor,
+         self.plex.users_toggle) = _get_plex_settings(self.settings_data)
         
         # Handle skip settings
         skip_users = self.settings_data.get('skip_users')
         if skip_users is not None:
             self.plex.skip_ondeck = self.settings_data.get('skip_ondeck', skip_users)
             self.plex.skip_watchlist = self.settings_data.get('skip_watchlist', skip_users)
-            del self.settings_data['skip_users']
         else:
             self.plex.skip_ondeck = self.settings_data.get('skip_ondeck', [])
             self.plex.skip_watchlist = self.settings_data.get('skip_watchlist', [])
     
     def _load_cache_config(self) -> None:
         """Load cache-related configuration."""
-        self.cache.watchlist_toggle = self.settings_data['watchlist_toggle']
-        self.cache.watchlist_episodes = self.settings_data['watchlist_episodes']
-        self.cache.watchlist_cache_expiry = self.settings_data['watchlist_cache_expiry']
-        self.cache.watched_cache_expiry = self.settings_data['watched_cache_expiry']
-        self.cache.watched_move = self.settings_data['watched_move']
+        (self.cache.watchlist_toggle, self.cache.watchlist_episodes,
+         self.cache.watchlist_cache_expiry, self.cache.watched_cache_expiry,
+         self.cache.watched_move) = _get_cache_settings(self.settings_data)
 
         # Load new remote watchlist settings
         self.cache.remote_watchlist_toggle = self.settings_data.get('remote_watchlist_toggle', False)
@@ -185,43 +247,38 @@ class ConfigManager:
     
     def _load_path_config(self) -> None:
         """Load path-related configuration."""
-        self.paths.plex_source = self._add_trailing_slashes(self.settings_data['plex_source'])
-        self.paths.real_source = self._add_trailing_slashes(self.settings_data['real_source'])
-        self.paths.cache_dir = self._add_trailing_slashes(self.settings_data['cache_dir'])
-        self.paths.nas_library_folders = self._remove_all_slashes(self.settings_data['nas_library_folders'])
-        self.paths.plex_library_folders = self._remove_all_slashes(self.settings_data['plex_library_folders'])
+        plex_source, real_source, cache_dir, nas_library_folders, plex_library_folders = \
+            _get_path_settings(self.settings_data)
+        self.paths.plex_source = self._add_trailing_slashes(plex_source)
+        self.paths.real_source = self._add_trailing_slashes(real_source)
+        self.paths.cache_dir = self._add_trailing_slashes(cache_dir)
+        self.paths.nas_library_folders = self._remove_all_slashes(nas_library_folders)
+        self.paths.plex_library_folders = self._remove_all_slashes(plex_library_folders)
     
     def _load_performance_config(self) -> None:
         """Load performance-related configuration."""
-        self.performance.max_concurrent_moves_array = self.settings_data['max_concurrent_moves_array']
-        self.performance.max_concurrent_moves_cache = self.settings_data['max_concurrent_moves_cache']
+        (self.performance.max_concurrent_moves_array,
+         self.performance.max_concurrent_moves_cache) = _get_performance_settings(self.settings_data)
     
     def _load_misc_config(self) -> None:
         """Load miscellaneous configuration."""
         self.exit_if_active_session = self.settings_data.get('exit_if_active_session')
         if self.exit_if_active_session is None:
             self.exit_if_active_session = not self.settings_data.get('skip', False)
-            if 'skip' in self.settings_data:
-                del self.settings_data['skip']
-        
-        # Remove deprecated settings
-        if 'unraid' in self.settings_data:
-            del self.settings_data['unraid']
+
+    def _prune_deprecated_keys(self) -> None:
+        """Drop deprecated settings in one pass once the loaders have read them."""
+        if not _DEPRECATED_KEYS.isdisjoint(self.settings_data):
+            self.settings_data = {
+                key: value for key, value in self.settings_data.items()
+                if key not in _DEPRECATED_KEYS
+            }
     
     def _validate_required_fields(self) -> None:
         """Validate that all required fields exist in the configuration."""
         logging.debug("Validating required fields...")
 
-        required_fields = [
-            'PLEX_URL', 'PLEX_TOKEN', 'number_episodes', 'valid_sections',
-            'days_to_monitor', 'users_toggle', 'watchlist_toggle',
-            'watchlist_episodes', 'watchlist_cache_expiry', 'watched_cache_expiry',
-            'watched_move', 'plex_source', 'cache_dir', 'real_source',
-            'nas_library_folders', 'plex_library_folders',
-            'max_concurrent_moves_array', 'max_concurrent_moves_cache'
-        ]
-
-        missing_fields = [field for field in required_fields if field not in self.settings_data]
+        missing_fields = sorted(_REQUIRED_FIELDS.difference(self.settings_data))
         if missing_fields:
             logging.error(f"Missing required fields in settings: {missing_fields}")
             raise ValueError(f"Missing required fields in settings: {missing_fields}")
@@ -232,29 +289,8 @@ class ConfigManager:
         """Validate that configuration values have correct types."""
         logging.debug("Validating configuration types...")
 
-        type_checks = {
-            'PLEX_URL': str,
-            'PLEX_TOKEN': str,
-            'number_episodes': int,
-            'valid_sections': list,
-            'days_to_monitor': int,
-            'users_toggle': bool,
-            'watchlist_toggle': bool,
-            'watchlist_episodes': int,
-            'watchlist_cache_expiry': int,
-            'watched_cache_expiry': int,
-            'watched_move': bool,
-            'plex_source': str,
-            'cache_dir': str,
-            'real_source': str,
-            'nas_library_folders': list,
-            'plex_library_folders': list,
-            'max_concurrent_moves_array': int,
-            'max_concurrent_moves_cache': int,
-        }
-
         type_errors = []
-        for field, expected_type in type_checks.items():
+        for field, expected_type in _TYPE_CHECKS.items():
             if field in self.settings_data:
                 value = self.settings_data[field]
                 if not isinstance(value, expected_type):
@@ -274,29 +310,17 @@ class ConfigManager:
         logging.debug("Validating configuration values...")
         errors = []
 
-        # Validate non-empty paths
-        path_fields = ['plex_source', 'real_source', 'cache_dir']
-        for field in path_fields:
+        # Validate non-empty paths, URL and token
+        for field in _NON_EMPTY_FIELDS:
             if not self.settings_data.get(field, '').strip():
                 errors.append(f"'{field}' cannot be empty")
 
         # Validate positive integers
-        positive_int_fields = [
-            'number_episodes', 'days_to_monitor', 'watchlist_episodes',
-            'watchlist_cache_expiry', 'watched_cache_expiry',
-            'max_concurrent_moves_array', 'max_concurrent_moves_cache'
-        ]
-        for field in positive_int_fields:
+        for field in _NON_NEGATIVE_INT_FIELDS:
             value = self.settings_data.get(field, 0)
             if value < 0:
                 errors.append(f"'{field}' must be non-negative, got {value}")
 
-        # Validate non-empty URL and token
-        if not self.settings_data.get('PLEX_URL', '').strip():
-            errors.append("'PLEX_URL' cannot be empty")
-        if not self.settings_data.get('PLEX_TOKEN', '').strip():
-            errors.append("'PLEX_TOKEN' cannot be empty")
-
         if errors:
             error_msg = "Configuration validation errors: " + "; ".join(errors)
             logging.error(error_msg)
@@ -304,22 +328,33 @@ class ConfigManager:
 
         logging.debug("Value validation successful")
     
+    def _sync_back(self) -> None:
+        """Write normalized values back into settings_data in place."""
+        settings = self.settings_data
+        settings['cache_dir'] = self.paths.cache_dir
+        settings['real_source'] = self.paths.real_source
+        settings['plex_source'] = self.paths.plex_source
+        settings['nas_library_folders'] = self.paths.nas_library_folders
+        settings['plex_library_folders'] = self.paths.plex_library_folders
+        settings['skip_ondeck'] = self.plex.skip_ondeck
+        settings['skip_watchlist'] = self.plex.skip_watchlist
+        settings['exit_if_active_session'] = self.exit_if_active_session
+
     def _save_updated_config(self) -> None:
         """Save updated configuration back to file."""
         try:
-            self.settings_data.update({
-                'cache_dir': self.paths.cache_dir,
-                'real_source': self.paths.real_source,
-                'plex_source': self.paths.plex_source,
-                'nas_library_folders': self.paths.nas_library_folders,
-                'plex_library_folders': self.paths.plex_library_folders,
-                'skip_ondeck': self.plex.skip_ondeck,
-                'skip_watchlist': self.plex.skip_watchlist,
-                'exit_if_active_session': self.exit_if_active_session,
-            })
-
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings_data, f, indent=4)
+            self._sync_back()
+
+            new_bytes = _json_dumps(self.settings_data)
+            if new_bytes == self._original_bytes:
+                logging.debug("Configuration unchanged, skipping settings file write")
+                return
+
+            # Write to a temp file and swap it in so an interrupted save never truncates the settings
+            tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+            tmp_file.write_bytes(new_bytes)
+            os.replace(tmp_file, self.config_file)
+            self._original_bytes = new_bytes
         except Exception as e:
             logging.error(f"Error saving settings: {type(e).__name__}: {e}")
             raise
@@ -327,23 +362,27 @@ class ConfigManager:
     @staticmethod
     def _add_trailing_slashes(value: str) -> str:
         """Add trailing slashes to a path."""
-        if ':' not in value:  # Not a Windows path
-            if not value.startswith("/"):
-                value = "/" + value
-            if not value.endswith("/"):
-                value = value + "/"
-        return value
+        if ':' in value:  # Windows path, leave as-is
+            return value
+        # Build the result in one allocation; repeated edge slashes collapse to one
+        core = value.strip('/')
+        return f"/{core}/" if core else "/"
     
     @staticmethod
     def _remove_all_slashes(value_list: List[str]) -> List[str]:
         """Remove all slashes from a list of paths."""
         return [value.strip('/\\') for value in value_list]
     
-    def get_cache_files(self) -> Tuple[Path, Path, Path]:
-        """Get cache file paths."""
+    @cached_property
+    def cache_files(self) -> Tuple[Path, Path, Path]:
+        """Cache file paths, built once since script_folder does not change after startup."""
         script_folder = Path(self.paths.script_folder)
         return (
             script_folder / "plexcache_watchlist_cache.json",
             script_folder / "plexcache_watched_cache.json",
             script_folder / "plexcache_mover_files_to_exclude.txt"
-        ) 
+        )
+
+    def get_cache_files(self) -> Tuple[Path, Path, Path]:
+        """Get cache file paths."""
+        return self.cache_files
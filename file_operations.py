@@ -4,12 +4,24 @@ Handles file moving, filtering, subtitle operations, and path modifications.
 """
 
 import os
+import stat
 import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Set, Optional, Tuple
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 import re
 
+# Unraid user share (cache + array) and array-only mount points
+_MNT_USER = "/mnt/user/"
+_MNT_USER0 = "/mnt/user0/"
+
+
+def _prefix_swap(path: str, old: str, new: str) -> str:
+    """Replace a leading prefix of a path; paths without the prefix are returned unchanged."""
+    if path.startswith(old):
+        return new + path[len(old):]
+    return path
+
 
 class FilePathModifier:
     """Handles file path modifications and conversions."""
@@ -20,6 +32,22 @@ class FilePathModifier:
         self.real_source = real_source
         self.plex_library_folders = plex_library_folders
         self.nas_library_folders = nas_library_folders
+
+        # One compiled alternation finds the library folder in a single scan; longer folders are
+        # tried first so e.g. "movies-4k" is not shadowed by "movies" at the same position
+        self._folder_map = dict(zip(plex_library_folders, nas_library_folders))
+        if self._folder_map:
+            alternation = "|".join(re.escape(folder) for folder in
+                                   sorted(self._folder_map, key=len, reverse=True))
+            self._folder_re = re.compile(alternation)
+        else:
+            self._folder_re = None
+        # Converted path per Plex path; the mapping is fixed for the object's lifetime
+        self._converted: Dict[str, str] = {}
+
+    def _replace_folder(self, match: re.Match) -> str:
+        """Map a matched plex library folder to its NAS library folder."""
+        return self._folder_map[match.group(0)]
     
     def modify_file_paths(self, files: List[str]) -> List[str]:
         """Modify file paths from Plex paths to real system paths."""
@@ -27,86 +55,130 @@ class FilePathModifier:
             return []
 
         logging.info("Editing file paths...")
+        # Checked once so per-file messages are not formatted when INFO is filtered out
+        log_paths = logging.getLogger().isEnabledFor(logging.INFO)
+        return [self._modify_file_path(file_path, log_paths) for file_path in files]
 
-        result = []
-        for file_path in files:
-            # Pass through paths that are already converted (don't start with plex_source)
-            if not file_path.startswith(self.plex_source):
-                result.append(file_path)
-                continue
-
-            logging.info(f"Original path: {file_path}")
-
-            # Replace the plex_source with the real_source in the file path
-            file_path = file_path.replace(self.plex_source, self.real_source, 1)
-
-            # Determine which library folder is in the file path
-            for j, folder in enumerate(self.plex_library_folders):
-                if folder in file_path:
-                    # Replace the plex library folder with the corresponding NAS library folder
-                    file_path = file_path.replace(folder, self.nas_library_folders[j])
-                    break
-
-            result.append(file_path)
-            logging.info(f"Edited path: {file_path}")
-
-        return result
+    def modify_file_paths_set(self, files: Iterable[str]) -> Set[str]:
+        """Modify file paths like modify_file_paths, collecting them straight into a set."""
+        logging.info("Editing file paths...")
+        log_paths = logging.getLogger().isEnabledFor(logging.INFO)
+        return {self._modify_file_path(file_path, log_paths) for file_path in files}
+
+    def _modify_file_path(self, file_path: str, log_paths: bool) -> str:
+        """Modify a single file path, passing through paths that are already converted."""
+        if not file_path.startswith(self.plex_source):
+            return file_path
+
+        # The same paths come back from several phases; each one is only converted (and logged) once
+        converted = self._converted.get(file_path)
+        if converted is None:
+            converted = self._convert(file_path)
+            self._converted[file_path] = converted
+            if log_paths:
+                logging.info(f"Original path: {file_path}")
+                logging.info(f"Edited path: {converted}")
+        return converted
+
+    def _convert(self, file_path: str) -> str:
+        """Swap the plex_source prefix for real_source and the plex library folder for its NAS folder."""
+        tail = file_path[len(self.plex_source):]
+        if self._folder_re is not None:
+            tail = self._folder_re.sub(self._replace_folder, tail, count=1)
+        return self.real_source + tail
 
 
 class SubtitleFinder:
     """Handles subtitle file discovery and operations."""
+
+    # Upper bound on directories scanned at once; the scans are latency-bound metadata I/O
+    _MAX_SCAN_WORKERS = 8
     
     def __init__(self, subtitle_extensions: Optional[List[str]] = None):
         if subtitle_extensions is None:
             subtitle_extensions = [".srt", ".vtt", ".sbv", ".sub", ".idx"]
         self.subtitle_extensions = subtitle_extensions
+        # Lowercased once so matching is case-insensitive without rebuilding the tuple per call
+        self._extensions = tuple(ext.lower() for ext in subtitle_extensions)
+        # Subtitle candidates per directory, kept across calls so OnDeck, watchlist and watched
+        # media sharing a folder cost one scan per run
+        self._candidates_by_directory: Dict[str, List[Tuple[str, str]]] = {}
     
     def get_media_subtitles(self, media_files: List[str], files_to_skip: Optional[Set[str]] = None) -> List[str]:
         """Get subtitle files for media files."""
         logging.info("Fetching subtitles...")
+        log_subtitles = logging.getLogger().isEnabledFor(logging.INFO)
         
-        files_to_skip = set() if files_to_skip is None else set(files_to_skip)
-        processed_files = set()
-        all_media_files = media_files.copy()
-        
-        for file in media_files:
-            if file in files_to_skip or file in processed_files:
-                continue
-            processed_files.add(file)
-            
-            directory_path = os.path.dirname(file)
-            if os.path.exists(directory_path):
-                subtitle_files = self._find_subtitle_files(directory_path, file)
-                all_media_files.extend(subtitle_files)
+        if files_to_skip is None:
+            files_to_skip = set()
+        subtitles: List[str] = []
+        candidates_by_directory = self._candidates_by_directory
+
+        # Deduplicate in first-seen order and drop skipped files
+        files = [file for file in dict.fromkeys(media_files) if file not in files_to_skip]
+        directories = [os.path.dirname(file) for file in files]
+
+        # Scan each directory not seen yet this run; separate folders are scanned concurrently
+        unscanned = [directory for directory in dict.fromkeys(directories)
+                     if directory not in candidates_by_directory]
+        if len(unscanned) > 1:
+            workers = min(self._MAX_SCAN_WORKERS, len(unscanned))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                candidates_by_directory.update(
+                    zip(unscanned, executor.map(self._scan_subtitle_candidates, unscanned))
+                )
+        elif unscanned:
+            candidates_by_directory[unscanned[0]] = self._scan_subtitle_candidates(unscanned[0])
+
+        for file, directory_path in zip(files, directories):
+            subtitle_files = self._find_subtitle_files(candidates_by_directory[directory_path], file)
+            subtitles.extend(subtitle_files)
+            if log_subtitles:
                 for subtitle_file in subtitle_files:
                     logging.info(f"Subtitle found: {subtitle_file}")
 
-        return all_media_files
-    
-    def _find_subtitle_files(self, directory_path: str, file: str) -> List[str]:
-        """Find subtitle files in a directory for a given media file."""
-        file_basename = os.path.basename(file)
-        file_name, _ = os.path.splitext(file_basename)
+        return [*media_files, *subtitles]
 
+    def _scan_subtitle_candidates(self, directory_path: str) -> List[Tuple[str, str]]:
+        """List (name, path) of the subtitle files in a directory."""
         try:
-            subtitle_files = [
-                entry.path
-                for entry in os.scandir(directory_path)
-                if entry.is_file() and entry.name.startswith(file_name) and
-                   entry.name != file_basename and entry.name.endswith(tuple(self.subtitle_extensions))
-            ]
+            # Cheap name check first; is_file() last since it may need a stat
+            with os.scandir(directory_path) as entries:
+                return [
+                    (entry.name, entry.path)
+                    for entry in entries
+                    if entry.name.lower().endswith(self._extensions) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
         except PermissionError as e:
             logging.error(f"Cannot access directory {directory_path}. Permission denied. {type(e).__name__}: {e}")
-            subtitle_files = []
         except OSError as e:
             logging.error(f"Cannot access directory {directory_path}. {type(e).__name__}: {e}")
-            subtitle_files = []
+        return []
+    
+    def _find_subtitle_files(self, candidates: List[Tuple[str, str]], file: str) -> List[str]:
+        """Find subtitle files for a given media file among its directory's subtitle candidates."""
+        file_basename = os.path.basename(file)
+        file_name, _ = os.path.splitext(file_basename)
+        if not file_name:
+            return [path for name, path in candidates if name != file_basename]
 
-        return subtitle_files
+        # Cheap length and first-character checks reject most names before startswith
+        name_length = len(file_name)
+        first_char = file_name[0]
+        return [
+            path for name, path in candidates
+            if len(name) >= name_length and name[0] == first_char
+            and name.startswith(file_name) and name != file_basename
+        ]
 
 
 class FileFilter:
     """Handles file filtering based on destination and conditions."""
+
+    # Upper bound on concurrent deletions of redundant copies
+    _MAX_REMOVAL_WORKERS = 4
     
     def __init__(self, real_source: str, cache_dir: str, is_unraid: bool, 
                  mover_cache_exclude_file: str):
@@ -114,81 +186,143 @@ class FileFilter:
         self.cache_dir = cache_dir
         self.is_unraid = is_unraid
         self.mover_cache_exclude_file = mover_cache_exclude_file or ""
+        # Regular-file names per directory, scanned once per filter pass (None if unlistable)
+        self._dir_cache: Dict[str, Optional[Set[str]]] = {}
+        # Cache directory for each source directory
+        self._cache_path_by_dir: Dict[str, str] = {}
+        # Redundant (path, copy label) pairs, deleted together once planning is done
+        self._pending_removals: List[Tuple[str, str]] = []
     
     def filter_files(self, files: List[str], destination: str, 
                     media_to_cache: Optional[List[str]] = None, 
                     files_to_skip: Optional[Set[str]] = None) -> List[str]:
         """Filter files based on destination and conditions."""
-        if media_to_cache is None:
-            media_to_cache = []
+        # Set for O(1) membership checks in _should_add_to_array; only the array direction consults it
+        media_to_cache_set = set(media_to_cache) if media_to_cache and destination == 'array' else set()
 
-        processed_files = set()
         media_to = []
-        cache_files_to_exclude = []
 
         if not files:
             return []
 
-        for file in files:
-            if file in processed_files or (files_to_skip and file in files_to_skip):
-                continue
-            processed_files.add(file)
-            
-            cache_file_name = self._get_cache_paths(file)[1]
-            cache_files_to_exclude.append(cache_file_name)
-            
-            if destination == 'array':
-                if self._should_add_to_array(file, cache_file_name, media_to_cache):
-                    media_to.append(file)
-                    logging.info(f"Adding file to array: {file}")
+        # Deduplicate in first-seen order and drop skipped files in one pass
+        if files_to_skip:
+            files = [file for file in dict.fromkeys(files) if file not in files_to_skip]
+        else:
+            files = dict.fromkeys(files)
 
-            elif destination == 'cache':
-                if self._should_add_to_cache(file, cache_file_name):
-                    media_to.append(file)
-                    logging.info(f"Adding file to cache: {file}")
+        log_added = logging.getLogger().isEnabledFor(logging.INFO)
+        try:
+            for file in files:
+                cache_file_name = self._get_cache_paths(file)[1]
+
+                if destination == 'array':
+                    if self._should_add_to_array(file, cache_file_name, media_to_cache_set):
+                        media_to.append(file)
+                        if log_added:
+                            logging.info(f"Adding file to array: {file}")
+
+                elif destination == 'cache':
+                    if self._should_add_to_cache(file, cache_file_name):
+                        media_to.append(file)
+                        if log_added:
+                            logging.info(f"Adding file to cache: {file}")
+        finally:
+            # Directory listings go stale once files are moved, so never keep them across calls
+            self._dir_cache.clear()
+            self._flush_removals()
 
         return media_to
+
+    def _flush_removals(self) -> None:
+        """Delete the redundant copies queued during planning."""
+        pending, self._pending_removals = self._pending_removals, []
+        if not pending:
+            return
+        workers = min(self._MAX_REMOVAL_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Drain the iterator so every removal has finished before returning
+            list(executor.map(self._remove_file, pending))
+
+    @staticmethod
+    def _remove_file(removal: Tuple[str, str]) -> None:
+        """Remove a redundant copy of a file, logging the outcome."""
+        path, label = removal
+        try:
+            os.remove(path)
+            logging.info(f"Removed {label} version of file: {path}")
+        except FileNotFoundError:
+            pass  # File already removed or never existed
+        except OSError as e:
+            logging.error(f"Failed to remove {label} file {path}: {type(e).__name__}: {e}")
+
+    def _files_in(self, directory: str) -> Optional[Set[str]]:
+        """Get the names of regular files in a directory, scanning it at most once per filter pass."""
+        if directory in self._dir_cache:
+            return self._dir_cache[directory]
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            names = set()
+        except OSError:
+            # Listing not permitted; fall back to stat-ing individual files
+            names = None
+        self._dir_cache[directory] = names
+        return names
+
+    def _is_regular_file(self, path: str) -> bool:
+        """Check whether a path is a regular file, using the cached directory listing when available."""
+        directory, name = os.path.split(path)
+        names = self._files_in(directory)
+        if names is not None:
+            return name in names
+        try:
+            return stat.S_ISREG(os.stat(path).st_mode)
+        except OSError:
+            return False
+
+    def _forget_file(self, path: str) -> None:
+        """Drop a removed file from the cached directory listing."""
+        directory, name = os.path.split(path)
+        names = self._files_in(directory)
+        if names is not None:
+            names.discard(name)
     
-    def _should_add_to_array(self, file: str, cache_file_name: str, media_to_cache: List[str]) -> bool:
+    def _should_add_to_array(self, file: str, cache_file_name: str, media_to_cache: Set[str]) -> bool:
         """Determine if a file should be added to the array."""
         if file in media_to_cache:
             return False
 
-        array_file = file.replace("/mnt/user/", "/mnt/user0/", 1) if self.is_unraid else file
+        array_file = _prefix_swap(file, _MNT_USER, _MNT_USER0) if self.is_unraid else file
 
-        if os.path.isfile(array_file):
-            # File already exists in the array, try to remove cache version
-            try:
-                os.remove(cache_file_name)
-                logging.info(f"Removed cache version of file: {cache_file_name}")
-            except FileNotFoundError:
-                pass  # File already removed or never existed
-            except OSError as e:
-                logging.error(f"Failed to remove cache file {cache_file_name}: {type(e).__name__}: {e}")
+        if self._is_regular_file(array_file):
+            # File already exists in the array, queue removal of the cache version
+            self._forget_file(cache_file_name)
+            self._pending_removals.append((cache_file_name, 'cache'))
             return False  # No need to add to array
         return True  # Otherwise, the file should be added to the array
 
     def _should_add_to_cache(self, file: str, cache_file_name: str) -> bool:
         """Determine if a file should be added to the cache."""
-        array_file = file.replace("/mnt/user/", "/mnt/user0/", 1) if self.is_unraid else file
+        array_file = _prefix_swap(file, _MNT_USER, _MNT_USER0) if self.is_unraid else file
 
-        if os.path.isfile(cache_file_name) and os.path.isfile(array_file):
-            # Remove the array version when the file exists in the cache
-            try:
-                os.remove(array_file)
-                logging.info(f"Removed array version of file: {array_file}")
-            except FileNotFoundError:
-                pass  # File already removed
-            except OSError as e:
-                logging.error(f"Failed to remove array file {array_file}: {type(e).__name__}: {e}")
+        if self._is_regular_file(cache_file_name) and self._is_regular_file(array_file):
+            # Queue removal of the array version when the file exists in the cache
+            self._forget_file(array_file)
+            self._pending_removals.append((array_file, 'array'))
             return False
 
-        return not os.path.isfile(cache_file_name)
+        return not self._is_regular_file(cache_file_name)
     
     def _get_cache_paths(self, file: str) -> Tuple[str, str]:
         """Get cache path and filename for a given file."""
         # Get the cache path by replacing the real source directory with the cache directory
-        cache_path = os.path.dirname(file).replace(self.real_source, self.cache_dir, 1)
+        directory = os.path.dirname(file)
+        cache_path = self._cache_path_by_dir.get(directory)
+        if cache_path is None:
+            cache_path = _prefix_swap(directory, self.real_source, self.cache_dir)
+            self._cache_path_by_dir[directory] = cache_path
         
         # Get the cache file name by joining the cache path with the base name of the file
         cache_file_name = os.path.join(cache_path, os.path.basename(file))
@@ -220,9 +354,9 @@ class FileFilter:
                 if media_name is not None:
                     needed_media.add(media_name)
 
-            # Check each file in cache
+            # Check each file in cache; existence comes from one scan per cache directory
             for cache_file in cache_files:
-                if not os.path.exists(cache_file):
+                if not self._is_regular_file(cache_file):
                     logging.debug(f"Cache file no longer exists: {cache_file}")
                     cache_paths_to_remove.append(cache_file)
                     continue
@@ -239,7 +373,7 @@ class FileFilter:
                     continue
 
                 # Media is no longer needed, move this file back to array
-                array_file = cache_file.replace(self.cache_dir, self.real_source, 1)
+                array_file = _prefix_swap(cache_file, self.cache_dir, self.real_source)
 
                 logging.info(f"Media no longer needed, will move back to array: {media_name} - {cache_file}")
                 files_to_move_back.append(array_file)
@@ -249,6 +383,8 @@ class FileFilter:
 
         except Exception as e:
             logging.exception(f"Error getting files to move back to array: {type(e).__name__}: {e}")
+        finally:
+            self._dir_cache.clear()
 
         return files_to_move_back, cache_paths_to_remove
 
@@ -262,8 +398,12 @@ class FileFilter:
             filename = os.path.basename(file_path)
             name, _ext = os.path.splitext(filename)
 
-            # Remove trailing parentheses blocks
-            cleaned = re.sub(r'\s*\([^)]*\)$', '', name).strip()
+            # Remove a trailing parentheses block, e.g. "Title (2020)"
+            if name.endswith(')'):
+                open_index = name.find('(', name.rfind(')', 0, -1) + 1)
+                if open_index != -1:
+                    name = name[:open_index]
+            cleaned = name.strip()
 
             return cleaned
 
@@ -277,20 +417,17 @@ class FileFilter:
                 logging.warning("Exclude file does not exist, cannot remove files")
                 return False
 
-            # Read current exclude list
-            with open(self.mover_cache_exclude_file, 'r') as f:
-                current_files = [line.strip() for line in f if line.strip()]
-
             # Convert to set for O(1) lookup instead of O(n)
             paths_to_remove_set = set(cache_paths_to_remove)
 
-            # Remove specified files
-            updated_files = [f for f in current_files if f not in paths_to_remove_set]
-
-            # Write back updated list
-            with open(self.mover_cache_exclude_file, 'w') as f:
-                for file_path in updated_files:
-                    f.write(f"{file_path}\n")
+            # Stream the kept entries into a temp file, then swap it in atomically
+            tmp_file = self.mover_cache_exclude_file + ".tmp"
+            with open(self.mover_cache_exclude_file, 'r') as src, open(tmp_file, 'w') as dst:
+                for line in src:
+                    file_path = line.strip()
+                    if file_path and file_path not in paths_to_remove_set:
+                        dst.write(f"{file_path}\n")
+            os.replace(tmp_file, self.mover_cache_exclude_file)
 
             logging.info(f"Removed {len(cache_paths_to_remove)} files from exclude list")
             return True
@@ -312,6 +449,10 @@ class FileMover:
         self.debug = debug
         self.mover_cache_exclude_file = mover_cache_exclude_file
         self._exclude_file_lock = threading.Lock()
+        # Cache file names moved in the current batch, appended to the exclude file in one write
+        self._exclude_pending: List[str] = []
+        # Worker pool kept across move_media_files calls; see _get_executor
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def move_media_files(self, files: List[str], destination: str, 
                         max_concurrent_moves_array: int, max_concurrent_moves_cache: int) -> None:
@@ -319,20 +460,28 @@ class FileMover:
         logging.info(f"Moving media files to {destination}...")
         logging.debug(f"Total files to process: {len(files)}")
         
-        processed_files = set()
-        move_commands = []
-        cache_file_names = []
+        planned = []
+        # Destination directory -> file whose owner it inherits, so each directory is created once
+        dest_dirs: Dict[str, str] = {}
 
-        # Iterate over each file to move
-        for file_to_move in files:
-            if file_to_move in processed_files:
-                continue
-            
-            processed_files.add(file_to_move)
-            
+        # dict.fromkeys drops duplicates while keeping the original order
+        for file_to_move in dict.fromkeys(files):
             # Get the user path, cache path, cache file name, and user file name
-            user_path, cache_path, cache_file_name, user_file_name = self._get_paths(file_to_move)
-            
+            paths = self._get_paths(file_to_move)
+            user_path, cache_path, cache_file_name, user_file_name = paths
+            planned.append((file_to_move, paths))
+            if destination == 'array':
+                dest_dirs.setdefault(user_path, cache_file_name)
+            elif destination == 'cache':
+                dest_dirs.setdefault(cache_path, user_file_name)
+
+        # Only create directories if not in debug mode (true dry-run)
+        if not self.debug:
+            for dest_dir, permissions_source in dest_dirs.items():
+                self.file_utils.create_directory_with_permissions(dest_dir, permissions_source)
+
+        move_commands = []
+        for file_to_move, (user_path, cache_path, cache_file_name, user_file_name) in planned:
             # Get the move command for the current file
             move = self._get_move_command(destination, cache_file_name, user_path, user_file_name, cache_path)
             
@@ -364,7 +513,7 @@ class FileMover:
         
         # Modify the user path if unraid is True
         if self.is_unraid:
-            user_path = user_path.replace("/mnt/user/", "/mnt/user0/", 1)
+            user_path = _prefix_swap(user_path, _MNT_USER, _MNT_USER0)
 
         # Get the user file name by joining the user path with the base name of the file to move
         user_file_name = os.path.join(user_path, os.path.basename(file_to_move))
@@ -376,15 +525,9 @@ class FileMover:
         """Get the move command for a file."""
         move = None
         if destination == 'array':
-            # Only create directories if not in debug mode (true dry-run)
-            if not self.debug:
-                self.file_utils.create_directory_with_permissions(user_path, cache_file_name)
             if os.path.isfile(cache_file_name):
                 move = (cache_file_name, user_path)
         elif destination == 'cache':
-            # Only create directories if not in debug mode (true dry-run)
-            if not self.debug:
-                self.file_utils.create_directory_with_permissions(cache_path, user_file_name)
             if not os.path.isfile(cache_file_name):
                 move = (user_file_name, cache_path)
         return move
@@ -398,11 +541,46 @@ class FileMover:
                 logging.info(move_cmd)
         else:
             max_concurrent_moves = max_concurrent_moves_array if destination == 'array' else max_concurrent_moves_cache
+            # Never run more moves at once than there are moves; extra writers only add seek contention
+            workers = max(1, min(max_concurrent_moves, len(move_commands)))
+            # The shared pool is sized for the larger limit, so the destination's limit is enforced here
+            move_slots = threading.BoundedSemaphore(workers)
             from functools import partial
-            with ThreadPoolExecutor(max_workers=max_concurrent_moves) as executor:
-                results = list(executor.map(partial(self._move_file, destination=destination), move_commands))
+            move = partial(self._move_file, destination=destination)
+
+            def bounded_move(move_cmd_with_cache: Tuple[Tuple[str, str], str]) -> int:
+                with move_slots:
+                    return move(move_cmd_with_cache)
+
+            try:
+                executor = self._get_executor(max(1, max_concurrent_moves_array, max_concurrent_moves_cache))
+                results = list(executor.map(bounded_move, move_commands))
                 errors = [result for result in results if result != 0]
                 logging.info(f"Finished moving files with {len(errors)} errors.")
+            finally:
+                # Record whatever made it to the cache, even if the batch was interrupted
+                self._flush_exclude_entries()
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Return the shared move pool, created once at the configured maximum."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the shared move pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _flush_exclude_entries(self) -> None:
+        """Append the pending cache file names to the exclude file in a single write."""
+        with self._exclude_file_lock:
+            pending, self._exclude_pending = self._exclude_pending, []
+        if pending:
+            with open(self.mover_cache_exclude_file, "a") as f:
+                f.write("\n".join(pending) + "\n")
+            logging.debug(f"Added {len(pending)} files to the exclude list")
     
     def _move_file(self, move_cmd_with_cache: Tuple[Tuple[str, str], str], destination: str) -> int:
         """Move a single file and update exclude file if moving to cache."""
@@ -410,12 +588,11 @@ class FileMover:
         try:
             self.file_utils.move_file(src, dest)
             logging.info(f"Moved file from {src} to {dest} with original permissions and owner.")
-            # Only append to exclude file if moving to cache and move succeeded
-            # Use lock to prevent concurrent writes from corrupting the file
+            # Only record for the exclude file if moving to cache and move succeeded;
+            # the batch is written once all moves have finished
             if destination == 'cache' and self.mover_cache_exclude_file:
                 with self._exclude_file_lock:
-                    with open(self.mover_cache_exclude_file, "a") as f:
-                        f.write(f"{cache_file_name}\n")
+                    self._exclude_pending.append(cache_file_name)
             return 0
         except Exception as e:
             logging.error(f"Error moving file: {type(e).__name__}: {e}")
@@ -428,6 +605,9 @@ class CacheCleanup:
     # Directories that should never be cleaned (safety check)
     _PROTECTED_PATHS = {'/', '/mnt', '/mnt/user', '/mnt/user0', '/home', '/var', '/etc', '/usr'}
 
+    # Upper bound on library folders walked at once; the walk is latency-bound metadata I/O
+    _MAX_CLEANUP_WORKERS = 8
+
     def __init__(self, cache_dir: str, library_folders: List[str] = None):
         if not cache_dir or not cache_dir.strip():
             raise ValueError("cache_dir cannot be empty")
@@ -450,19 +630,24 @@ class CacheCleanup:
         else:
             # Fallback: scan all subdirectories in cache_dir
             try:
-                subdirs_to_clean = [d for d in os.listdir(self.cache_dir)
-                                   if os.path.isdir(os.path.join(self.cache_dir, d))]
+                with os.scandir(self.cache_dir) as entries:
+                    subdirs_to_clean = [entry.name for entry in entries if entry.is_dir(follow_symlinks=False)]
             except OSError as e:
                 logging.error(f"Could not list cache directory {self.cache_dir}: {type(e).__name__}: {e}")
                 subdirs_to_clean = []
 
+        # Missing folders are reported by the walk itself rather than stat-ed up front
+        subdir_paths = []
         for subdir in subdirs_to_clean:
             subdir_path = os.path.join(self.cache_dir, subdir)
-            if os.path.exists(subdir_path):
-                logging.debug(f"Cleaning up {subdir} directory: {subdir_path}")
-                cleaned_count += self._cleanup_directory(subdir_path)
-            else:
-                logging.debug(f"Directory does not exist, skipping: {subdir_path}")
+            logging.debug(f"Cleaning up {subdir} directory: {subdir_path}")
+            subdir_paths.append(subdir_path)
+
+        # Library folders are disjoint trees, so they can be walked concurrently
+        if subdir_paths:
+            workers = min(self._MAX_CLEANUP_WORKERS, len(subdir_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                cleaned_count += sum(executor.map(self._cleanup_directory, subdir_paths))
         
         if cleaned_count > 0:
             logging.info(f"Cleaned up {cleaned_count} empty folders")
@@ -472,21 +657,29 @@ class CacheCleanup:
     def _cleanup_directory(self, directory_path: str) -> int:
         """Recursively remove empty folders from a directory."""
         cleaned_count = 0
+        # Folders removed so far; the walk is bottom-up, so children are settled before their parent
+        removed: Set[str] = set()
         
         try:
-            # Walk through the directory tree from bottom up
-            for root, dirs, files in os.walk(directory_path, topdown=False):
-                for dir_name in dirs:
-                    dir_path = os.path.join(root, dir_name)
+            # A folder is empty when the walk saw no files in it and every subfolder was removed,
+            # so no second listing per folder is needed
+            for root, dirs, files in os.walk(directory_path, topdown=False, onerror=self._log_walk_error):
+                if root == directory_path or files:
+                    continue
+                if all(os.path.join(root, dir_name) in removed for dir_name in dirs):
                     try:
-                        # Check if directory is empty
-                        if not os.listdir(dir_path):
-                            os.rmdir(dir_path)
-                            logging.debug(f"Removed empty folder: {dir_path}")
-                            cleaned_count += 1
+                        os.rmdir(root)
+                        removed.add(root)
+                        logging.debug(f"Removed empty folder: {root}")
+                        cleaned_count += 1
                     except OSError as e:
-                        logging.debug(f"Could not remove directory {dir_path}: {type(e).__name__}: {e}")
+                        logging.debug(f"Could not remove directory {root}: {type(e).__name__}: {e}")
         except Exception as e:
             logging.error(f"Error cleaning up directory {directory_path}: {type(e).__name__}: {e}")
         
-        return cleaned_count 
+        return cleaned_count
+
+    @staticmethod
+    def _log_walk_error(error: OSError) -> None:
+        """Log a directory the cleanup walk could not list, e.g. a library folder that does not exist."""
+        logging.debug(f"Skipping directory {error.filename}: {type(error).__name__}: {error}")
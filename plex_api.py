@@ -5,22 +5,81 @@ Handles Plex server connections and media fetching operations.
 
 import json
 import logging
+import os
+import re
+import threading
 import time
 import xml.etree.ElementTree as ET
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from io import BytesIO
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Set, Optional, Generator, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Set, Optional, Generator, Tuple, Union
 
 from plexapi.server import PlexServer
+from plexapi.library import LibrarySection
 from plexapi.video import Episode, Movie
 from plexapi.myplex import MyPlexAccount
 from plexapi.exceptions import NotFound, BadRequest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder
+    orjson = None
+
+# Trailing release year on RSS titles, e.g. "Movie (2023)"
+_RSS_YEAR_RE = re.compile(r"\s\(\d{4}\)$")
+
+
+def _xml_int(element: ET.Element, attribute: str) -> Optional[int]:
+    """Read an integer attribute from a Plex XML element, or None if it is absent."""
+    value = element.get(attribute)
+    return int(value) if value else None
+
+
+def _show_episode_elements(server: PlexServer, show_key: int) -> List[ET.Element]:
+    """Fetch a show's episodes as raw XML, in season/episode order."""
+    # The allLeaves XML already carries the index, view and Media/Part data that is read here;
+    # Episode objects would re-fetch themselves whenever one of those attributes is empty
+    return server.query(f'/library/metadata/{show_key}/allLeaves').findall('Video')
+
+
+class _RateLimiter:
+    """Thread-safe token bucket that only blocks once the burst allowance is used up."""
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self._capacity = rate
+        self._tokens = rate
+        self._fill_rate = rate / per
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._fill_rate
+            time.sleep(wait)
 
 
 class PlexManager:
     """Manages Plex server connections and operations."""
+
+    # Concurrent per-user Plex requests; threads are only started as work arrives
+    _MAX_FETCH_WORKERS = 10
+    # Per-user fetches started per second before new ones are held back
+    _FETCH_START_RATE = 5
     
     def __init__(self, plex_url: str, plex_token: str, retry_limit: int = 3, delay: int = 5):
         self.plex_url = plex_url
@@ -28,50 +87,179 @@ class PlexManager:
         self.retry_limit = retry_limit
         self.delay = delay
         self.plex = None
+        self._my_account: Optional[MyPlexAccount] = None
+        # Switched home-user accounts by user id
+        self._home_accounts: Dict[int, MyPlexAccount] = {}
+        # PlexServer per user token, so each user's server is bootstrapped once per run
+        self._user_servers: Dict[str, PlexServer] = {}
+        # Library sections of the connected server by key, fetched once per run
+        self._sections_by_key: Optional[Dict[int, LibrarySection]] = None
+        # Valid section keys present on the server, per configured valid_sections
+        self._filtered_sections: Dict[FrozenSet[int], FrozenSet[int]] = {}
+        # (season, episode) keys and matching part files of each OnDeck show by grandparentRatingKey, sorted for bisect
+        self._show_episodes: Dict[int, Tuple[List[Tuple[int, int]], List[List[str]]]] = {}
+        # Movies and shows by casefolded title (None when ambiguous), per set of indexed section keys
+        self._title_index: Dict[FrozenSet[int], Dict[str, object]] = {}
+        self._title_index_lock = threading.Lock()
+        # Server search results for titles the index could not resolve
+        self._search_results: Dict[str, object] = {}
+        # Spaces out per-user fetch starts for rate-limit protection
+        self._fetch_limiter = _RateLimiter(self._FETCH_START_RATE)
+        # Worker pool reused by the OnDeck, watchlist and watched-media fetches
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Guards the lazily created pool, owner account and sections, which the
+        # concurrent fetch phases may all request first at the same time
+        self._init_lock = threading.RLock()
+        # Per-key locks so one home user or user server is set up once without serializing the others
+        self._key_locks: Dict[Tuple[str, object], threading.Lock] = {}
+        # One pooled session for every Plex and RSS request, so connections are kept alive
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create an HTTP session with a connection pool sized for the concurrent user fetches."""
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool shared by the per-user fetches, creating it on first use."""
+        with self._init_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._MAX_FETCH_WORKERS, thread_name_prefix='plex-io')
+            return self._executor
+
+    def _key_lock(self, kind: str, key) -> threading.Lock:
+        """Get the lock serializing the one-time setup of a single home user or user server."""
+        with self._init_lock:
+            return self._key_locks.setdefault((kind, key), threading.Lock())
+
+    def close(self) -> None:
+        """Shut down the fetch worker pool and close the pooled HTTP session."""
+        with self._init_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._session.close()
         
     def connect(self) -> None:
         """Connect to the Plex server."""
         logging.info(f"Connecting to Plex server: {self.plex_url}")
         
         try:
-            self.plex = PlexServer(self.plex_url, self.plex_token)
+            self.plex = PlexServer(self.plex_url, self.plex_token, session=self._session)
             logging.info("Successfully connected to Plex server")
             logging.debug(f"Plex server version: {self.plex.version}")
         except Exception as e:
             logging.error(f"Error connecting to the Plex server: {e}")
             raise ConnectionError(f"Error connecting to the Plex server: {e}")
     
+    def _get_my_account(self) -> MyPlexAccount:
+        """Get the MyPlex account of the server owner, fetching it from plex.tv only once."""
+        with self._init_lock:
+            if self._my_account is None:
+                self._my_account = self.plex.myPlexAccount()
+            return self._my_account
+
+    def _get_home_account(self, user) -> MyPlexAccount:
+        """Get the switched account of a home user, signing in to plex.tv only once per user."""
+        with self._key_lock('home', user.id):
+            account = self._home_accounts.get(user.id)
+            if account is None:
+                account = self._get_my_account().switchHomeUser(user.title)
+                self._home_accounts[user.id] = account
+            return account
+
+    def _get_sections_by_key(self) -> Dict[int, LibrarySection]:
+        """Get the server's library sections keyed by section key, fetching them only once."""
+        with self._init_lock:
+            if self._sections_by_key is None:
+                self._sections_by_key = {section.key: section for section in self.plex.library.sections()}
+            return self._sections_by_key
+
+    def _filter_section_keys(self, valid_sections: List[int]) -> FrozenSet[int]:
+        """Get the keys of the valid sections that exist on the server."""
+        valid_keys = frozenset(valid_sections or ())
+        filtered = self._filtered_sections.get(valid_keys)
+        if filtered is None:
+            filtered = frozenset(self._get_sections_by_key().keys() & valid_keys)
+            self._filtered_sections[valid_keys] = filtered
+        return filtered
+
     def get_plex_instance(self, user=None) -> Tuple[Optional[str], Optional[PlexServer]]:
         """Get Plex instance for a specific user."""
         if user:
             username = user.title
             try:
-                return username, PlexServer(self.plex_url, user.get_token(self.plex.machineIdentifier))
+                token = user.get_token(self.plex.machineIdentifier)
+                with self._key_lock('server', token):
+                    plex_instance = self._user_servers.get(token)
+                    if plex_instance is None:
+                        plex_instance = PlexServer(self.plex_url, token, session=self._session)
+                        self._user_servers[token] = plex_instance
+                return username, plex_instance
             except Exception as e:
                 logging.error(f"Error: Failed to fetch {username} onDeck media. Error: {e}")
                 return None, None
         else:
-            username = self.plex.myPlexAccount().title
-            return username, PlexServer(self.plex_url, self.plex_token)
+            # The main account uses the owner token, so the connected server already serves it
+            username = self._get_my_account().title
+            return username, self.plex
     
-    def search_plex(self, title: str):
-        """Search for a file in the Plex server."""
+    def _get_title_index(self, section_keys: FrozenSet[int]) -> Dict[str, object]:
+        """Get the movie and show title index of the given sections (all video sections when empty), loading them once."""
+        with self._title_index_lock:
+            index = self._title_index.get(section_keys)
+            if index is None:
+                index = {}
+                try:
+                    for key, section in self._get_sections_by_key().items():
+                        # Unmonitored sections would only add discarded hits and false ambiguities
+                        if section.type not in ('movie', 'show') or (section_keys and key not in section_keys):
+                            continue
+                        for item in section.all():
+                            title_key = item.title.casefold()
+                            # Titles shared by several items are left to the server's ranked search
+                            index[title_key] = None if title_key in index else item
+                    logging.debug(f"Indexed {len(index)} movie and show titles")
+                except Exception as e:
+                    # Every lookup then falls back to a server search
+                    logging.warning(f"Could not build the library title index: {e}")
+                    index = {}
+                self._title_index[section_keys] = index
+            return index
+
+    def search_plex(self, title: str, section_keys: FrozenSet[int] = frozenset()):
+        """Search for a file in the Plex server, checking the title index of the given sections first."""
+        key = title.casefold()
+        item = self._get_title_index(section_keys).get(key)
+        if item is not None:
+            return item
+        # Remember server search outcomes, misses included, so a title is searched once per run
+        if key in self._search_results:
+            return self._search_results[key]
         results = self.plex.search(title)
-        return results[0] if len(results) > 0 else None
+        item = results[0] if len(results) > 0 else None
+        self._search_results[key] = item
+        return item
     
     def get_active_sessions(self) -> List:
         """Get active sessions from Plex."""
         return self.plex.sessions()
     
     def get_on_deck_media(self, valid_sections: List[int], days_to_monitor: int, 
-                        number_episodes: int, users_toggle: bool, skip_ondeck: List[str]) -> List[str]:
+                        number_episodes: int, users_toggle: bool, skip_ondeck: List[str]) -> Iterator[str]:
         """Get OnDeck media files, skipping users with no token to prevent 401 errors."""
-        on_deck_files = []
+        # Users often share OnDeck items, so yield each path once
+        on_deck_files: Set[str] = set()
 
         # Build list of users to fetch
         users_to_fetch = [None]  # Always include main local account
         if users_toggle:
-            for user in self.plex.myPlexAccount().users():
+            for user in self._get_my_account().users():
                 try:
                     token = user.get_token(self.plex.machineIdentifier)
                     if not token:
@@ -87,23 +275,27 @@ class PlexManager:
         logging.info(f"Fetching OnDeck media for {len(users_to_fetch)} users")
 
         # Fetch concurrently
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {
-                executor.submit(
-                    self._fetch_user_on_deck_media, 
-                    valid_sections, days_to_monitor, number_episodes, user
-                )
-                for user in users_to_fetch
-            }
-
-            for future in as_completed(futures):
-                try:
-                    on_deck_files.extend(future.result())
-                except Exception as e:
-                    logging.error(f"An error occurred while fetching OnDeck media for a user: {e}")
+        executor = self._get_executor()
+        futures = {
+            executor.submit(
+                self._fetch_user_on_deck_media, 
+                valid_sections, days_to_monitor, number_episodes, user
+            )
+            for user in users_to_fetch
+        }
+
+        for future in as_completed(futures):
+            try:
+                user_files = future.result()
+            except Exception as e:
+                logging.error(f"An error occurred while fetching OnDeck media for a user: {e}")
+                continue
+            for file_path in user_files:
+                if file_path not in on_deck_files:
+                    on_deck_files.add(file_path)
+                    yield file_path
 
         logging.info(f"Found {len(on_deck_files)} OnDeck items")
-        return on_deck_files
 
     
     def _fetch_user_on_deck_media(self, valid_sections: List[int], days_to_monitor: int, 
@@ -118,23 +310,32 @@ class PlexManager:
             logging.info(f"Fetching {username}'s onDeck media...")
             
             on_deck_files = []
-            # Get all sections available for the user
-            available_sections = [section.key for section in plex_instance.library.sections()]
-            filtered_sections = list(set(available_sections) & set(valid_sections))
-
-            for video in plex_instance.library.onDeck():
-                section_key = video.section().key
+            # Restrict to the valid sections that exist on the server
+            filtered_sections = self._filter_section_keys(valid_sections)
+
+            # Read the raw OnDeck XML; only the attributes below are needed, so plexapi
+            # objects are only built for shows whose next episodes are fetched
+            on_deck = plex_instance.query('/library/onDeck')
+            now = datetime.now()
+            for video in on_deck if on_deck is not None else ():
+                title = video.get('title')
+                section_key = _xml_int(video, 'librarySectionID')
                 if not filtered_sections or section_key in filtered_sections:
-                    delta = datetime.now() - video.lastViewedAt
+                    last_viewed_at = _xml_int(video, 'lastViewedAt')
+                    if last_viewed_at is None:
+                        logging.debug(f"Skipping OnDeck item '{title}' — no lastViewedAt")
+                        continue
+                    delta = now - datetime.fromtimestamp(last_viewed_at)
                     if delta.days <= days_to_monitor:
-                        if isinstance(video, Episode):
-                            self._process_episode_ondeck(video, number_episodes, on_deck_files)
-                        elif isinstance(video, Movie):
+                        video_type = video.get('type')
+                        if video_type == Episode.TYPE:
+                            self._process_episode_ondeck(plex_instance, video, number_episodes, on_deck_files)
+                        elif video_type == Movie.TYPE:
                             self._process_movie_ondeck(video, on_deck_files)
                         else:
-                            logging.warning(f"Skipping OnDeck item '{video.title}' — unknown type {type(video)}")
+                            logging.warning(f"Skipping OnDeck item '{title}' — unknown type {video_type}")
                 else:
-                    logging.debug(f"Skipping OnDeck item '{video.title}' — section {section_key} not in valid_sections {filtered_sections}")
+                    logging.debug(f"Skipping OnDeck item '{title}' — section {section_key} not in valid_sections {filtered_sections}")
 
             return on_deck_files
 
@@ -142,85 +343,102 @@ class PlexManager:
             logging.error(f"An error occurred while fetching onDeck media for {username}: {e}")
             return []
     
-    def _process_episode_ondeck(self, video: Episode, number_episodes: int, on_deck_files: List[str]) -> None:
-        """Process an episode from onDeck."""
-        for media in video.media:
-            on_deck_files.extend(part.file for part in media.parts)
+    def _process_episode_ondeck(self, plex_instance: PlexServer, video: ET.Element,
+                                number_episodes: int, on_deck_files: List[str]) -> None:
+        """Process an episode element from onDeck."""
+        on_deck_files.extend(part.get('file') for part in video.iterfind('Media/Part'))
 
         # Skip fetching next episodes if current episode has missing index data
-        if video.parentIndex is None or video.index is None:
-            logging.warning(f"Skipping next episode fetch for '{video.grandparentTitle}' - missing index data (parentIndex={video.parentIndex}, index={video.index})")
+        show_title = video.get('grandparentTitle')
+        current_season = _xml_int(video, 'parentIndex')
+        current_index = _xml_int(video, 'index')
+        if current_season is None or current_index is None:
+            logging.warning(f"Skipping next episode fetch for '{show_title}' - missing index data (parentIndex={current_season}, index={current_index})")
             return
 
-        show = video.grandparentTitle
-        library_section = video.section()
-        episodes = list(library_section.search(show)[0].episodes())
-        current_season = video.parentIndex
-        next_episodes = self._get_next_episodes(episodes, current_season, video.index, number_episodes)
-
-        for episode in next_episodes:
-            for media in episode.media:
-                on_deck_files.extend(part.file for part in media.parts)
-                for part in media.parts:
-                    logging.info(f"OnDeck found: {part.file}")
+        # Several users often have the same show on deck, so fetch its episodes once
+        show_key = _xml_int(video, 'grandparentRatingKey')
+        show_episodes = self._show_episodes.get(show_key)
+        if show_episodes is None:
+            show_episodes = self._index_episodes(_show_episode_elements(plex_instance, show_key))
+            self._show_episodes[show_key] = show_episodes
+        next_episodes = self._get_next_episodes(show_episodes, current_season, current_index, number_episodes)
+
+        for part_files in next_episodes:
+            on_deck_files.extend(part_files)
+            for file in part_files:
+                logging.info(f"OnDeck found: {file}")
     
-    def _process_movie_ondeck(self, video: Movie, on_deck_files: List[str]) -> None:
-        """Process a movie from onDeck."""
-        for media in video.media:
-            on_deck_files.extend(part.file for part in media.parts)
-            for part in media.parts:
-                logging.info(f"OnDeck found: {part.file}")
+    def _process_movie_ondeck(self, video: ET.Element, on_deck_files: List[str]) -> None:
+        """Process a movie element from onDeck."""
+        for part in video.iterfind('Media/Part'):
+            file = part.get('file')
+            on_deck_files.append(file)
+            logging.info(f"OnDeck found: {file}")
     
-    def _get_next_episodes(self, episodes: List[Episode], current_season: int,
-                          current_episode_index: int, number_episodes: int) -> List[Episode]:
-        """Get the next episodes after the current one."""
-        next_episodes = []
+    @staticmethod
+    def _index_episodes(episodes: List[ET.Element]) -> Tuple[List[Tuple[int, int]], List[List[str]]]:
+        """Sort a show's episodes by (season, episode), returning the keys and their part files as parallel lists."""
+        indexed_episodes = []
         for episode in episodes:
+            season = _xml_int(episode, 'parentIndex')
+            index = _xml_int(episode, 'index')
             # Skip episodes with missing index data
-            if episode.parentIndex is None or episode.index is None:
-                logging.debug(f"Skipping episode '{episode.title}' from '{episode.grandparentTitle}' - missing index data (parentIndex={episode.parentIndex}, index={episode.index})")
+            if season is None or index is None:
+                logging.debug(f"Skipping episode '{episode.get('title')}' from '{episode.get('grandparentTitle')}' - missing index data (parentIndex={season}, index={index})")
                 continue
-            if (episode.parentIndex > current_season or
-                (episode.parentIndex == current_season and episode.index > current_episode_index)) and len(next_episodes) < number_episodes:
-                next_episodes.append(episode)
-            if len(next_episodes) == number_episodes:
-                break
-        return next_episodes
+            part_files = [part.get('file') for part in episode.iterfind('Media/Part')]
+            indexed_episodes.append(((season, index), part_files))
+
+        # Plex returns episodes in season/episode order, so this sort is a linear pass
+        indexed_episodes.sort(key=itemgetter(0))
+        return [key for key, _files in indexed_episodes], [files for _key, files in indexed_episodes]
+
+    def _get_next_episodes(self, show_episodes: Tuple[List[Tuple[int, int]], List[List[str]]], current_season: int,
+                          current_episode_index: int, number_episodes: int) -> List[List[str]]:
+        """Get the part files of the next episodes after the current one from a show's cached index."""
+        keys, episodes = show_episodes
+        start = bisect_right(keys, (current_season, current_episode_index))
+        return episodes[start:start + number_episodes]
 
     def clean_rss_title(self, title: str) -> str:
         """Remove trailing year in parentheses from a title, e.g. 'Movie (2023)' -> 'Movie'."""
-        import re
-        return re.sub(r"\s\(\d{4}\)$", "", title)
+        return _RSS_YEAR_RE.sub("", title)
 
 
     def get_watchlist_media(self, valid_sections: List[int], watchlist_episodes: int, 
-                            users_toggle: bool, skip_watchlist: List[str], rss_url: Optional[str] = None) -> Generator[str, None, None]:
-        """Get watchlist media files, optionally via RSS, with proper user filtering."""
+                            users_toggle: bool, skip_watchlist: List[str],
+                            rss_url: Optional[Union[str, List[str]]] = None) -> Generator[str, None, None]:
+        """Get watchlist media files, optionally via one or more RSS feeds, with proper user filtering."""
+        rss_urls = [rss_url] if isinstance(rss_url, str) else list(rss_url or [])
 
         def fetch_rss_titles(url: str) -> List[Tuple[str, str]]:
             """Fetch titles and categories from a Plex RSS feed."""
             try:
-                resp = requests.get(url, timeout=10)
+                resp = self._session.get(url, timeout=10)
                 resp.raise_for_status()
-                root = ET.fromstring(resp.text)
                 items = []
-                for item in root.findall("channel/item"):
-                    title = item.find("title").text
-                    category_elem = item.find("category")
-                    category = category_elem.text if category_elem is not None else ""
-                    items.append((title, category))
+                # Parse the raw bytes incrementally, letting the XML declaration decide the encoding
+                for _event, item in ET.iterparse(BytesIO(resp.content)):
+                    if item.tag != "item":
+                        continue
+                    title = item.findtext("title")
+                    if title is not None:
+                        items.append((title, item.findtext("category") or ""))
+                    item.clear()
                 return items
             except Exception as e:
                 logging.error(f"Failed to fetch or parse RSS feed {url}: {e}")
                 return []
 
         def process_show(file, watchlist_episodes: int) -> Generator[str, None, None]:
-            episodes = file.episodes()
+            episodes = _show_episode_elements(self.plex, file.ratingKey)
             logging.debug(f"Processing show {file.title} with {len(episodes)} episodes")
             for episode in episodes[:watchlist_episodes]:
-                if len(episode.media) > 0 and len(episode.media[0].parts) > 0:
-                    if not episode.isPlayed:
-                        yield episode.media[0].parts[0].file
+                part = episode.find('Media/Part')
+                # An episode counts as played once its viewCount is set
+                if part is not None and not _xml_int(episode, 'viewCount'):
+                    yield part.get('file')
 
         def process_movie(file) -> Generator[str, None, None]:
             if len(file.media) > 0 and len(file.media[0].parts) > 0:
@@ -230,13 +448,12 @@ class PlexManager:
         def fetch_user_watchlist(user) -> Generator[str, None, None]:
             """Fetch watchlist media for a user, optionally via RSS, yielding file paths."""
 
-            time.sleep(1)  # slight delay for rate-limit protection
-            current_username = self.plex.myPlexAccount().title if user is None else user.title
+            self._fetch_limiter.acquire()  # rate-limit protection, only waits when many users start at once
+            current_username = self._get_my_account().title if user is None else user.title
             logging.info(f"Fetching watchlist media for {current_username}")
 
             # Build list of valid sections for filtering
-            available_sections = [section.key for section in self.plex.library.sections()]
-            filtered_sections = list(set(available_sections) & set(valid_sections))
+            filtered_sections = self._filter_section_keys(valid_sections)
 
             # Skip users in the skip list
             if user:
@@ -253,11 +470,11 @@ class PlexManager:
             try:
                 if user is None:
                     # Use already authenticated main account
-                    account = self.plex.myPlexAccount()
+                    account = self._get_my_account()
                 else:
                     # Try to switch to home user
                     try:
-                        account = self.plex.myPlexAccount().switchHomeUser(user.title)
+                        account = self._get_home_account(user)
                     except Exception as e:
                         logging.warning(f"Could not switch to user {user.title}; skipping. Error: {e}")
                         return
@@ -266,12 +483,11 @@ class PlexManager:
                 return
 
             # --- RSS feed processing ---
-            if rss_url:
-                rss_items = fetch_rss_titles(rss_url)
-                logging.info(f"RSS feed contains {len(rss_items)} items")
+            if rss_urls:
+                logging.info(f"RSS feeds contain {len(rss_items)} items")
                 for title, category in rss_items:
                     cleaned_title = self.clean_rss_title(title)
-                    file = self.search_plex(cleaned_title)
+                    file = self.search_plex(cleaned_title, filtered_sections)
                     if file:
                         logging.info(f"RSS title '{title}' matched Plex item '{file.title}' ({file.TYPE})")
                         if not filtered_sections or file.librarySectionID in filtered_sections:
@@ -295,7 +511,7 @@ class PlexManager:
                 watchlist = account.watchlist(filter='released')
                 logging.info(f"{current_username}: Found {len(watchlist)} watchlist items from Plex")
                 for item in watchlist:
-                    file = self.search_plex(item.title)
+                    file = self.search_plex(item.title, filtered_sections)
                     if file and (not filtered_sections or file.librarySectionID in filtered_sections):
                         try:
                             if file.TYPE == 'show':
@@ -312,11 +528,17 @@ class PlexManager:
                 logging.error(f"Error fetching watchlist for {current_username}: {e}")
 
 
+        # --- Fetch RSS feeds once, concurrently, before the per-user work ---
+        rss_items: List[Tuple[str, str]] = []
+        if rss_urls:
+            for feed_items in self._get_executor().map(fetch_rss_titles, rss_urls):
+                rss_items.extend(feed_items)
+
         # --- Prepare users to fetch ---
         users_to_fetch = [None]  # always include the main local account
 
         if users_toggle:
-            for user in self.plex.myPlexAccount().users():
+            for user in self._get_my_account().users():
                 title = getattr(user, "title", None)
                 username = getattr(user, "username", None)  # None for local/home users
 
@@ -339,22 +561,35 @@ class PlexManager:
         logging.info(f"Processing {len(users_to_fetch)} users for local Plex watchlist")
 
         # --- Fetch concurrently ---
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(fetch_user_watchlist, user) for user in users_to_fetch}
-            for future in as_completed(futures):
-                retries = 0
-                while retries < self.retry_limit:
-                    try:
-                        yield from future.result()
+        # The same title can be on several users' watchlists; yield each path once
+        seen = set()
+
+        def collect_user_watchlist(user) -> List[str]:
+            # Drain the generator on the worker thread; submitting the generator function
+            # itself would only create it there and leave all the fetching to the consumer
+            return list(fetch_user_watchlist(user))
+
+        executor = self._get_executor()
+        futures = {executor.submit(collect_user_watchlist, user): user for user in users_to_fetch}
+        for future in as_completed(futures):
+            user = futures[future]
+            retries = 0
+            while retries < self.retry_limit:
+                try:
+                    for file_path in future.result():
+                        if file_path not in seen:
+                            seen.add(file_path)
+                            yield file_path
+                    break
+                except Exception as e:
+                    if "429" in str(e):
+                        logging.warning(f"Rate limit exceeded. Retrying in {self.delay} seconds... Error: {e}")
+                        time.sleep(self.delay)
+                        retries += 1
+                        future = executor.submit(collect_user_watchlist, user)
+                    else:
+                        logging.error(f"Error fetching watchlist media: {e}")
                         break
-                    except Exception as e:
-                        if "429" in str(e):
-                            logging.warning(f"Rate limit exceeded. Retrying in {self.delay} seconds... Error: {e}")
-                            time.sleep(self.delay)
-                            retries += 1
-                        else:
-                            logging.error(f"Error fetching watchlist media: {e}")
-                            break
 
 
 
@@ -376,38 +611,55 @@ class PlexManager:
                     if episode.isPlayed:
                         yield part.file
 
+        last_updated_at = datetime.fromtimestamp(last_updated) if last_updated else None
+
+        def search_watched(section: LibrarySection) -> List:
+            """Search a section for watched items, letting the server drop ones not viewed since the last run."""
+            if last_updated_at:
+                try:
+                    return section.search(unwatched=False, filters={'lastViewedAt>>=': last_updated_at})
+                except (BadRequest, NotFound) as e:
+                    # Older servers may not expose the field for this section type; filter locally instead
+                    logging.debug(f"Server-side lastViewedAt filter unavailable for '{section.title}': {e}")
+            return section.search(unwatched=False)
+
         def fetch_user_watched_media(plex_instance: PlexServer, username: str) -> Generator[str, None, None]:
-            time.sleep(1)
+            self._fetch_limiter.acquire()
             try:
                 logging.info(f"Fetching {username}'s watched media...")
-                all_sections = [section.key for section in plex_instance.library.sections()]
-                available_sections = list(set(all_sections) & set(valid_sections)) if valid_sections else all_sections
+                sections_by_key = self._get_sections_by_key()
+                available_sections = self._filter_section_keys(valid_sections) if valid_sections else sections_by_key.keys()
 
                 for section_key in available_sections:
-                    section = plex_instance.library.sectionByID(section_key)
+                    section = sections_by_key[section_key]
                     # Skip non-video sections (music, photos) - they don't support 'unwatched' filter
                     if section.type not in ('movie', 'show'):
                         logging.debug(f"Skipping non-video section '{section.title}' (type: {section.type})")
                         continue
-                    for video in section.search(unwatched=False):
-                        if last_updated and video.lastViewedAt and video.lastViewedAt < datetime.fromtimestamp(last_updated):
+                    for video in search_watched(section):
+                        if last_updated_at and video.lastViewedAt and video.lastViewedAt < last_updated_at:
                             continue
                         yield from process_video(video)
             except Exception as e:
                 logging.error(f"Error fetching watched media for {username}: {e}")
 
         # --- Only fetch for main local user ---
-        with ThreadPoolExecutor() as executor:
-            main_username = self.plex.myPlexAccount().title
-            futures = [executor.submit(fetch_user_watched_media, self.plex, main_username)]
+        # Yield each path once so repeated items don't create duplicate move work
+        seen = set()
+        executor = self._get_executor()
+        main_username = self._get_my_account().title
+        futures = [executor.submit(fetch_user_watched_media, self.plex, main_username)]
 
-            logging.info(f"Processing watched media for local user: {main_username} only")
+        logging.info(f"Processing watched media for local user: {main_username} only")
 
-            for future in as_completed(futures):
-                try:
-                    yield from future.result()
-                except Exception as e:
-                    logging.error(f"An error occurred in get_watched_media: {e}")
+        for future in as_completed(futures):
+            try:
+                for file_path in future.result():
+                    if file_path not in seen:
+                        seen.add(file_path)
+                        yield file_path
+            except Exception as e:
+                logging.error(f"An error occurred in get_watched_media: {e}")
 
 
 
@@ -416,23 +668,32 @@ class CacheManager:
     
     @staticmethod
     def load_media_from_cache(cache_file: Path) -> Tuple[Set[str], Optional[float]]:
-        if cache_file.exists():
-            with cache_file.open('r') as f:
-                try:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        return set(data.get('media', [])), data.get('timestamp')
-                    elif isinstance(data, list):
-                        return set(data), None
-                except json.JSONDecodeError:
-                    with cache_file.open('w') as f:
-                        f.write(json.dumps({'media': [], 'timestamp': None}))
-                    return set(), None
+        try:
+            raw = cache_file.read_bytes()
+        except FileNotFoundError:
+            return set(), None
+        try:
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if isinstance(data, dict):
+                return set(data.get('media', [])), data.get('timestamp')
+            elif isinstance(data, list):
+                return set(data), None
+        except json.JSONDecodeError:  # orjson's decode error subclasses this one
+            CacheManager._write_cache(cache_file, {'media': [], 'timestamp': None})
+            return set(), None
         return set(), None
     
     @staticmethod
     def save_media_to_cache(cache_file: Path, media_list: List[str], timestamp: Optional[float] = None) -> None:
         if timestamp is None:
             timestamp = datetime.now().timestamp()
-        with cache_file.open('w') as f:
-            json.dump({'media': media_list, 'timestamp': timestamp}, f)
+        # Sorted and deduplicated so a rewrite with the same media produces an identical file
+        CacheManager._write_cache(cache_file, {'media': sorted(set(media_list)), 'timestamp': timestamp})
+
+    @staticmethod
+    def _write_cache(cache_file: Path, data: dict) -> None:
+        """Write cache data atomically so an interrupted run never leaves a truncated file."""
+        payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, cache_file)
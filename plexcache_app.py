@@ -6,16 +6,14 @@ Orchestrates all components and provides the main business logic.
 import sys
 import time
 import logging
-import re
-from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from config import ConfigManager
 from logging_config import LoggingManager
 from system_utils import SystemDetector, PathConverter, FileUtils
-from plex_api import PlexManager, CacheManager
 from file_operations import FilePathModifier, SubtitleFinder, FileFilter, FileMover, CacheCleanup
 
 
@@ -37,16 +35,23 @@ class PlexCacheApp:
         # Will be initialized after config loading
         self.logging_manager = None
         self.plex_manager = None
+        self.cache_manager = None
         self.file_path_modifier = None
         self.subtitle_finder = None
         self.file_filter = None
         self.file_mover = None
+        # (watchlist, watched, mover exclude) cache file paths, resolved once in _initialize_components
+        self._cache_files: Optional[Tuple[Path, Path, Path]] = None
+        # stat() results of the cache files (None when missing), dropped whenever a cache file is rewritten
+        self._stat_cache: Dict[Path, Optional[os.stat_result]] = {}
         
         # State variables
-        self.files_to_skip = []
+        self.files_to_skip: Set[str] = set()
         self.media_to_cache = []
-        self.media_to_array = []
+        self.media_to_array: Set[str] = set()
         self.ondeck_items = set()
+        # Modified watchlist paths (what the watchlist cache file holds), set once _process_watchlist succeeds
+        self._watchlist_items: Optional[Set[str]] = None
         
     def run(self) -> None:
         """Run the main application."""
@@ -120,6 +125,9 @@ class PlexCacheApp:
         """Initialize components that depend on configuration."""
         logging.info("Initializing application components...")
         
+        # Imported here so plexapi and requests are only loaded once the configuration is valid
+        from plex_api import PlexManager, CacheManager
+
         # Initialize Plex manager
         logging.debug("Initializing Plex manager...")
         self.plex_manager = PlexManager(
@@ -128,6 +136,7 @@ class PlexCacheApp:
             retry_limit=self.config_manager.performance.retry_limit,
             delay=self.config_manager.performance.delay
         )
+        self.cache_manager = CacheManager()
         
         # Initialize file operation components
         logging.debug("Initializing file operation components...")
@@ -141,7 +150,8 @@ class PlexCacheApp:
         self.subtitle_finder = SubtitleFinder()
         
         # Get cache files
-        watchlist_cache, watched_cache, mover_exclude = self.config_manager.get_cache_files()
+        self._cache_files = self.config_manager.get_cache_files()
+        watchlist_cache, watched_cache, mover_exclude = self._cache_files
         logging.debug(f"Cache files: watchlist={watchlist_cache}, watched={watched_cache}, exclude={mover_exclude}")
         
         self.file_filter = FileFilter(
@@ -189,27 +199,59 @@ class PlexCacheApp:
     
     def _process_active_sessions(self, sessions: List) -> None:
         """Process active sessions and add files to skip list."""
+        media_ids = []
         for session in sessions:
             try:
-                media_path = self._get_media_path_from_session(session)
+                media_ids.append(self._get_media_id_from_session(session))
+            except Exception as e:
+                logging.error(f"Error processing session {session}: {type(e).__name__}: {e}")
+                media_ids.append(None)
+
+        media_items = self._fetch_session_media_items([media_id for media_id in media_ids if media_id is not None])
+
+        for session, media_id in zip(sessions, media_ids):
+            if media_id is None:
+                continue
+            try:
+                media_item = media_items.get(media_id)
+                if media_item is None:
+                    media_item = self.plex_manager.plex.fetchItem(media_id)
+                media_path = self._get_media_path_from_item(media_item)
                 if media_path:
                     logging.info(f"Skipping active session file: {media_path}")
-                    self.files_to_skip.append(media_path)
+                    self.files_to_skip.add(media_path)
             except Exception as e:
                 logging.error(f"Error processing session {session}: {type(e).__name__}: {e}")
 
-    def _get_media_path_from_session(self, session) -> Optional[str]:
-        """Extract media file path from a Plex session. Returns None if unable to extract."""
+    def _fetch_session_media_items(self, media_ids: List[int]) -> Dict[int, object]:
+        """Fetch the media items of all active sessions in one request, keyed by rating key."""
+        if not media_ids:
+            return {}
         try:
-            media = str(session.source())
-            # Use regex for safer parsing: extract ID between first two colons
-            match = re.search(r':(\d+):', media)
-            if not match:
-                logging.warning(f"Could not parse media ID from session source: {media}")
+            # /library/metadata accepts a comma-separated list of rating keys
+            key = f"/library/metadata/{','.join(str(media_id) for media_id in dict.fromkeys(media_ids))}"
+            return {item.ratingKey: item for item in self.plex_manager.plex.fetchItems(key)}
+        except Exception as e:
+            # Fall back to fetching each session's item individually
+            logging.debug(f"Batch fetch of session media failed: {type(e).__name__}: {e}")
+            return {}
+
+    def _get_media_id_from_session(self, session) -> Optional[int]:
+        """Extract the media rating key from a Plex session. Returns None if unable to extract."""
+        try:
+            # The session item carries its rating key; session.source() would refetch the item just to parse it
+            rating_key = session.ratingKey
+            if rating_key is None:
+                logging.warning(f"Could not get media ID from session: {session}")
                 return None
+            return int(rating_key)
+        except (ValueError, AttributeError) as e:
+            logging.error(f"Error extracting media path: {type(e).__name__}: {e}")
+            return None
 
-            media_id = int(match.group(1))
-            media_item = self.plex_manager.plex.fetchItem(media_id)
+    def _get_media_path_from_item(self, media_item) -> Optional[str]:
+        """Extract the media file path from a session's media item. Returns None if unable to extract."""
+        try:
             media_title = media_item.title
             media_type = media_item.type
 
@@ -237,14 +279,19 @@ class PlexCacheApp:
         """Check if a cache file is expired. Returns True if expired or file doesn't exist."""
         if self.skip_cache or self.debug:
             return True
-        try:
-            if not cache_file.exists():
-                return True
-            mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            return datetime.now() - mtime > timedelta(hours=expiry_hours)
-        except (OSError, FileNotFoundError):
-            # File was deleted between exists() check and stat() call
+        cache_stat = self._stat(cache_file)
+        if cache_stat is None:
             return True
+        return time.time() - cache_stat.st_mtime > expiry_hours * 3600
+
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """Get the stat() result of a cache file, or None if it does not exist."""
+        if path not in self._stat_cache:
+            try:
+                self._stat_cache[path] = path.stat()
+            except OSError:
+                self._stat_cache[path] = None
+        return self._stat_cache[path]
 
     def _set_debug_mode(self) -> None:
         """Set debug mode if enabled."""
@@ -261,72 +308,84 @@ class PlexCacheApp:
         # Use a set to collect already-modified paths (real source paths)
         modified_paths_set = set()
 
-        # Fetch OnDeck Media
-        logging.info("Fetching OnDeck media...")
-        ondeck_media = self.plex_manager.get_on_deck_media(
-            self.config_manager.plex.valid_sections or [],
-            self.config_manager.plex.days_to_monitor,
-            self.config_manager.plex.number_episodes,
-            self.config_manager.plex.users_toggle,
-            self.config_manager.plex.skip_ondeck or []
-        )
-
-        logging.info(f"Found {len(ondeck_media)} OnDeck items")
-
-        # Edit file paths for OnDeck media (convert plex paths to real paths)
-        logging.debug("Modifying file paths for OnDeck media...")
-        modified_ondeck = self.file_path_modifier.modify_file_paths(list(ondeck_media))
-
-        # Store modified OnDeck items for filtering later
-        self.ondeck_items = set(modified_ondeck)
-        modified_paths_set.update(self.ondeck_items)
-
-        # Fetch subtitles for OnDeck media (already using real paths)
-        logging.debug("Finding subtitles for OnDeck media...")
-        ondeck_with_subtitles = self.subtitle_finder.get_media_subtitles(list(self.ondeck_items), files_to_skip=set(self.files_to_skip))
-        subtitle_count = len(ondeck_with_subtitles) - len(self.ondeck_items)
-        modified_paths_set.update(ondeck_with_subtitles)
-        logging.debug(f"Found {subtitle_count} subtitle files for OnDeck media")
-
-        # Process watchlist (returns already-modified paths)
-        if self.config_manager.cache.watchlist_toggle:
-            logging.info("Processing watchlist media...")
-            watchlist_items = self._process_watchlist()
-            if watchlist_items:
-                modified_paths_set.update(watchlist_items)
-                logging.info(f"Added {len(watchlist_items)} watchlist items to cache set")
-        else:
-            logging.info("Watchlist processing is disabled")
+        # The OnDeck, watchlist and watched fetches only depend on Plex, so run them concurrently.
+        # The workers return Plex paths; path conversion and subtitle lookup stay on this thread
+        # because FilePathModifier and SubtitleFinder keep unlocked per-run caches.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            logging.info("Fetching OnDeck media...")
+            ondeck_future = pool.submit(
+                lambda: list(self.plex_manager.get_on_deck_media(
+                    self.config_manager.plex.valid_sections or [],
+                    self.config_manager.plex.days_to_monitor,
+                    self.config_manager.plex.number_episodes,
+                    self.config_manager.plex.users_toggle,
+                    self.config_manager.plex.skip_ondeck or []
+                ))
+            )
 
-        # Process watched media
-        if self.config_manager.cache.watched_move:
-            logging.info("Processing watched media...")
-            self._process_watched_media()
-            logging.info(f"Added {len(self.media_to_array)} watched items to array move list")
-        else:
-            logging.info("Watched media processing is disabled")
+            watchlist_future = None
+            if self.config_manager.cache.watchlist_toggle:
+                logging.info("Processing watchlist media...")
+                watchlist_future = pool.submit(self._fetch_watchlist)
+            else:
+                logging.info("Watchlist processing is disabled")
 
-        # Run modify_file_paths on all collected paths to ensure consistent path format
-        # (some sources like _process_watchlist may return a mix of modified and unmodified paths)
+            watched_future = None
+            if self.config_manager.cache.watched_move:
+                logging.info("Processing watched media...")
+                watched_future = pool.submit(self._fetch_watched_media)
+            else:
+                logging.info("Watched media processing is disabled")
+
+            ondeck_media = ondeck_future.result()
+            logging.info(f"Found {len(ondeck_media)} OnDeck items")
+
+            # Edit file paths for OnDeck media (convert plex paths to real paths)
+            logging.debug("Modifying file paths for OnDeck media...")
+            # Store modified OnDeck items for filtering later
+            self.ondeck_items = self.file_path_modifier.modify_file_paths_set(ondeck_media)
+            modified_paths_set.update(self.ondeck_items)
+
+            # Fetch subtitles for OnDeck media (already using real paths)
+            logging.debug("Finding subtitles for OnDeck media...")
+            ondeck_with_subtitles = self.subtitle_finder.get_media_subtitles(list(self.ondeck_items), files_to_skip=self.files_to_skip)
+            subtitle_count = len(ondeck_with_subtitles) - len(self.ondeck_items)
+            modified_paths_set.update(ondeck_with_subtitles)
+            logging.debug(f"Found {subtitle_count} subtitle files for OnDeck media")
+
+            # Watchlist processing returns already-modified paths
+            if watchlist_future is not None:
+                watchlist_items = self._process_watchlist(watchlist_future.result())
+                if watchlist_items:
+                    modified_paths_set.update(watchlist_items)
+                    logging.info(f"Added {len(watchlist_items)} watchlist items to cache set")
+
+            if watched_future is not None:
+                self._process_watched_media(watched_future.result())
+                logging.info(f"Added {len(self.media_to_array)} watched items to array move list")
+
+        # Every source above already returns real paths, so no second modify pass is needed
         logging.debug("Finalizing media to cache list...")
-        self.media_to_cache = self.file_path_modifier.modify_file_paths(list(modified_paths_set))
+        self.media_to_cache = list(modified_paths_set)
         logging.info(f"Total media items to cache: {len(self.media_to_cache)}")
 
         # Check for files that should be moved back to array (no longer needed in cache)
         logging.info("Checking for files to move back to array...")
         self._check_files_to_move_back_to_array()
 
-    def _process_watchlist(self) -> set:
-        """Process watchlist media (local API + remote RSS) and return a set of modified file paths and subtitles."""
+    def _fetch_watchlist(self) -> Optional[Tuple[Set[str], bool]]:
+        """Fetch watchlist Plex paths (local API + remote RSS) and whether they are new rather than cached; None on error."""
         result_set = set()
         try:
-            watchlist_cache, _, _ = self.config_manager.get_cache_files()
-            watchlist_media_set, last_updated = CacheManager.load_media_from_cache(watchlist_cache)
+            watchlist_cache, _, _ = self._cache_files
+            watchlist_media_set, last_updated = self.cache_manager.load_media_from_cache(watchlist_cache)
             current_watchlist_set = set()
 
-            logging.debug(f"Watchlist cache exists: {watchlist_cache.exists()}")
-            logging.debug(f"Watchlist cache last updated: {last_updated}")
-            logging.debug(f"Current watchlist items in cache: {len(watchlist_media_set)}")
+            # Guarded so the existence check does not stat the cache file when DEBUG output is off
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Watchlist cache exists: {self._stat(watchlist_cache) is not None}")
+                logging.debug(f"Watchlist cache last updated: {last_updated}")
+                logging.debug(f"Current watchlist items in cache: {len(watchlist_media_set)}")
 
             if self.system_detector.is_connected():
                 # Determine if cache should be refreshed
@@ -339,10 +398,11 @@ class PlexCacheApp:
                 if cache_expired:
                     logging.info(f"Cache expired: {watchlist_cache}")
                     
-                    # Delete old cache file if it exists
-                    if watchlist_cache.exists():
+                    # Delete old cache file if it exists (debug runs leave cache files as they are)
+                    if not self.debug and self._stat(watchlist_cache) is not None:
                         try:
                             watchlist_cache.unlink()
+                            self._stat_cache.pop(watchlist_cache, None)
                             logging.info(f"Cache file deleted: {watchlist_cache}")
                         except Exception as e:
                             logging.error(f"Failed to delete cache file {watchlist_cache}: {e}")
@@ -387,36 +447,60 @@ class PlexCacheApp:
                         except Exception as e:
                             logging.error(f"Failed to fetch remote watchlist via RSS: {str(e)}")
 
+                    return result_set, True
 
-                    # Modify file paths and fetch subtitles
-                    modified_items = self.file_path_modifier.modify_file_paths(list(result_set))
-                    result_set.update(modified_items)
-                    subtitles = self.subtitle_finder.get_media_subtitles(modified_items, files_to_skip=set(self.files_to_skip))
-                    result_set.update(subtitles)
-
-                    # Update cache file
-                    CacheManager.save_media_to_cache(watchlist_cache, list(result_set))
-
-                else:
-                    logging.info("Loading watchlist media from cache...")
-                    result_set.update(watchlist_media_set)
+                logging.info("Loading watchlist media from cache...")
             else:
                 logging.warning("Unable to connect to the internet, skipping fetching new watchlist media due to plexapi limitation.")
                 logging.info("Loading watchlist media from cache...")
-                result_set.update(watchlist_media_set)
+            return watchlist_media_set, False
+        except Exception as e:
+            logging.exception(f"An error occurred while processing the watchlist: {type(e).__name__}: {e}")
+            return None
 
+    def _process_watchlist(self, fetched: Optional[Tuple[Set[str], bool]]) -> Set[str]:
+        """Convert fetched watchlist paths, adding subtitles and saving the cache for new fetches."""
+        result_set = set()
+        if fetched is None:
+            return result_set
+        watchlist_media, is_new = fetched
+        try:
+            if is_new:
+                # Modify file paths and fetch subtitles; only real paths are kept from here on
+                result_set = self.file_path_modifier.modify_file_paths_set(watchlist_media)
+                subtitles = self.subtitle_finder.get_media_subtitles(list(result_set), files_to_skip=self.files_to_skip)
+                result_set.update(subtitles)
+
+                # Update cache file
+                watchlist_cache, _, _ = self._cache_files
+                self._save_media_cache(watchlist_cache, result_set)
+            else:
+                result_set = self._modified_cached_paths(watchlist_media)
+
+            self._watchlist_items = result_set
         except Exception as e:
             logging.exception(f"An error occurred while processing the watchlist: {type(e).__name__}: {e}")
 
         return result_set
 
+    def _modified_cached_paths(self, cached_paths: Set[str]) -> Set[str]:
+        """Convert paths loaded from a cache file; caches from older versions also hold Plex paths."""
+        return self.file_path_modifier.modify_file_paths_set(cached_paths)
+
+    def _save_media_cache(self, cache_file: Path, media: Set[str]) -> None:
+        """Write a media cache file, except in debug mode where nothing is moved and the cache would be wrong."""
+        if self.debug:
+            logging.debug(f"Debug mode, not writing cache file: {cache_file}")
+            return
+        self.cache_manager.save_media_to_cache(cache_file, list(media))
+        self._stat_cache.pop(cache_file, None)
     
-    def _process_watched_media(self) -> None:
-        """Process watched media."""
+    def _fetch_watched_media(self) -> Optional[Tuple[Set[str], bool]]:
+        """Fetch newly watched Plex paths, or the cached set if it is still fresh, and whether they are new; None on error."""
         try:
-            _, watched_cache, _ = self.config_manager.get_cache_files()
-            watched_media_set, last_updated = CacheManager.load_media_from_cache(watched_cache)
-            current_media_set = set()
+            _, watched_cache, _ = self._cache_files
+            watched_media_set, last_updated = self.cache_manager.load_media_from_cache(watched_cache)
+            new_media = set()
 
             # Check if cache should be refreshed
             cache_expired = self._is_cache_expired(
@@ -434,30 +518,40 @@ class PlexCacheApp:
                     self.config_manager.plex.users_toggle
                 ))
                 
-                # Add fetched media to the current media set
+                # Keep only files not already in the watched media set
                 for file_path in fetched_media:
-                    current_media_set.add(file_path)
-
-                    # Check if file is not already in the watched media set
                     if file_path not in watched_media_set:
-                        self.media_to_array.append(file_path)
+                        new_media.add(file_path)
+                return new_media, True
+
+            logging.info("Loading watched media from cache...")
+            return watched_media_set, False
+
+        except Exception as e:
+            logging.exception(f"An error occurred while processing the watched media: {type(e).__name__}: {e}")
+            return None
+
+    def _process_watched_media(self, fetched: Optional[Tuple[Set[str], bool]]) -> None:
+        """Add fetched watched media to the array move list, converting paths and saving the cache for new fetches."""
+        if fetched is None:
+            return
+        watched_media, is_new = fetched
+        try:
+            if is_new:
+                self.media_to_array.update(watched_media)
 
-                # Add new media to the watched media set
-                watched_media_set.update(self.media_to_array)
-                
                 # Modify file paths and add subtitles
-                self.media_to_array = self.file_path_modifier.modify_file_paths(self.media_to_array)
-                self.media_to_array.extend(
-                    self.subtitle_finder.get_media_subtitles(self.media_to_array, files_to_skip=set(self.files_to_skip))
+                self.media_to_array = self.file_path_modifier.modify_file_paths_set(self.media_to_array)
+                self.media_to_array.update(
+                    self.subtitle_finder.get_media_subtitles(list(self.media_to_array), files_to_skip=self.files_to_skip)
                 )
 
                 # Save updated watched media set to cache file
-                CacheManager.save_media_to_cache(watched_cache, self.media_to_array)
-
+                _, watched_cache, _ = self._cache_files
+                self._save_media_cache(watched_cache, self.media_to_array)
             else:
-                logging.info("Loading watched media from cache...")
                 # Add watched media from cache to the media array
-                self.media_to_array.extend(watched_media_set)
+                self.media_to_array.update(watched_media)
 
         except Exception as e:
             logging.exception(f"An error occurred while processing the watched media: {type(e).__name__}: {e}")
@@ -466,10 +560,12 @@ class PlexCacheApp:
         """Move files to their destinations."""
         # Move watched files to array
         if self.config_manager.cache.watched_move:
-            self._safe_move_files(self.media_to_array, 'array')
+            self._safe_move_files(list(self.media_to_array), 'array')
 
         # Move files to cache
-        logging.debug(f"Files being passed to cache move: {self.media_to_cache}")
+        # Guarded so the whole list is only stringified when DEBUG output is enabled
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Files being passed to cache move: {self.media_to_cache}")
         self._safe_move_files(self.media_to_cache, 'cache')
 
     def _safe_move_files(self, files: List[str], destination: str) -> None:
@@ -491,29 +587,27 @@ class PlexCacheApp:
     def _check_free_space_and_move_files(self, media_files: List[str], destination: str, 
                                         real_source: str, cache_dir: str) -> None:
         """Check free space and move files."""
+        # Skip the filesystem checks entirely when there is nothing to move
         media_files_filtered = self.file_filter.filter_files(
-            media_files, destination, self.media_to_cache, set(self.files_to_skip)
-        )
+            media_files, destination, self.media_to_cache, self.files_to_skip
+        ) if media_files else []
         
-        total_size, total_size_unit = self.file_utils.get_total_size_of_files(media_files_filtered)
+        total_size_bytes = self.file_utils.get_total_size_of_files(media_files_filtered)
         
-        if total_size > 0:
+        if total_size_bytes > 0:
+            # Sizes stay in bytes for the comparison; units are only for display
+            total_size, total_size_unit = self.file_utils.convert_bytes_to_readable_size(total_size_bytes)
             print(f"Moving {total_size:.2f} {total_size_unit} to {destination}")
             self.logging_manager.add_summary_message(
                 f"Total size of media files moved to {destination}: {total_size:.2f} {total_size_unit}"
             )
             
-            free_space, free_space_unit = self.file_utils.get_free_space(
+            free_space_bytes = self.file_utils.get_free_space(
                 cache_dir if destination == 'cache' else real_source
             )
             
             # Check if enough space
-            # Multipliers convert to KB as base unit (KB=1, MB=1024, GB=1024^2, TB=1024^3)
-            size_multipliers = {'KB': 1, 'MB': 1024, 'GB': 1024**2, 'TB': 1024**3}
-            total_size_kb = total_size * size_multipliers.get(total_size_unit, 1)
-            free_space_kb = free_space * size_multipliers.get(free_space_unit, 1)
-            
-            if total_size_kb > free_space_kb:
+            if total_size_bytes > free_space_bytes:
                 if not self.debug:
                     sys.exit(f"Not enough space on {destination} drive.")
                 else:
@@ -535,12 +629,14 @@ class PlexCacheApp:
             current_ondeck_items = self.ondeck_items
             current_watchlist_items = set()
             
-            # Get watchlist items from the processed media
-            if self.config_manager.cache.watchlist_toggle:
-                watchlist_cache, _, _ = self.config_manager.get_cache_files()
-                if watchlist_cache.exists():
-                    watchlist_media_set, _ = CacheManager.load_media_from_cache(watchlist_cache)
-                    current_watchlist_items = set(self.file_path_modifier.modify_file_paths(list(watchlist_media_set)))
+            # Get watchlist items from the processed media, reading the cache file only if processing failed
+            if self._watchlist_items is not None:
+                current_watchlist_items = self._watchlist_items
+            elif self.config_manager.cache.watchlist_toggle:
+                watchlist_cache, _, _ = self._cache_files
+                if self._stat(watchlist_cache) is not None:
+                    watchlist_media_set, _ = self.cache_manager.load_media_from_cache(watchlist_cache)
+                    current_watchlist_items = self._modified_cached_paths(watchlist_media_set)
             
             # Get files that should be moved back to array (tracked by exclude file)
             files_to_move_back, cache_paths_to_remove = self.file_filter.get_files_to_move_back_to_array(
@@ -549,7 +645,7 @@ class PlexCacheApp:
             
             if files_to_move_back:
                 logging.info(f"Found {len(files_to_move_back)} files to move back to array")
-                self.media_to_array.extend(files_to_move_back)
+                self.media_to_array.update(files_to_move_back)
                 # Remove these files from the exclude list since they're no longer in cache
                 self.file_filter.remove_files_from_exclude_list(cache_paths_to_remove)
             else:
@@ -571,28 +667,35 @@ class PlexCacheApp:
         logging.info("Special thanks to: - Bexem - BBergle - and everyone who contributed!")
         logging.info("*** The End ***")
         
-        # Clean up empty folders in cache
-        self.cache_cleanup.cleanup_empty_folders()
+        # Release the file mover's worker threads and the Plex HTTP connections
+        if self.file_mover:
+            self.file_mover.close()
+        if self.plex_manager:
+            self.plex_manager.close()
+
+        # Clean up empty folders in cache; debug runs leave the filesystem untouched
+        if not self.debug:
+            self.cache_cleanup.cleanup_empty_folders()
         
         self.logging_manager.shutdown()
 
     def _convert_time(self, execution_time_seconds: float) -> str:
         """Convert execution time to human-readable format."""
-        days, remainder = divmod(execution_time_seconds, 86400)
+        days, remainder = divmod(int(execution_time_seconds), 86400)
         hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
 
-        result_str = ""
-        if days > 0:
-            result_str += f"{int(days)} day{'s' if days > 1 else ''}, "
-        if hours > 0:
-            result_str += f"{int(hours)} hour{'s' if hours > 1 else ''}, "
-        if minutes > 0:
-            result_str += f"{int(minutes)} minute{'s' if minutes > 1 else ''}, "
-        if seconds > 0:
-            result_str += f"{int(seconds)} second{'s' if seconds > 1 else ''}"
-
-        return result_str.rstrip(", ") or "less than 1 second"
+        parts = []
+        if days:
+            parts.append(f"{days} day{'s' if days > 1 else ''}")
+        if hours:
+            parts.append(f"{hours} hour{'s' if hours > 1 else ''}")
+        if minutes:
+            parts.append(f"{minutes} minute{'s' if minutes > 1 else ''}")
+        if seconds:
+            parts.append(f"{seconds} second{'s' if seconds > 1 else ''}")
+
+        return ", ".join(parts) or "less than 1 second"
 
 
 def main():
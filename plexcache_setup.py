@@ -1,8 +1,11 @@
 import json, os, requests, ntpath, posixpath, subprocess, re
-from urllib.parse import urlparse
+from pathlib import Path
 from plexapi.server import PlexServer
 from plexapi.exceptions import BadRequest
 
+# Same reader/writer as the main script, so both produce the same settings file layout
+from config import _json_loads, _json_dumps
+
 # Script folder and settings file
 script_folder = os.path.dirname(os.path.abspath(__file__))
 settings_filename = os.path.join(script_folder, "plexcache_settings.json")
@@ -10,6 +13,16 @@ settings_filename = os.path.join(script_folder, "plexcache_settings.json")
 # ensure a settings container exists early so helper functions can reference it
 settings_data = {}
 
+# http(s) scheme, a host without spaces or slashes, optional port and path
+_PLEX_URL_RE = re.compile(r'^https?://[^\s/]+(?::\d+)?(?:/.*)?$', re.IGNORECASE)
+
+# Accepted answers for yes/no prompts
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+# Deletes single and double quotes pasted around paths
+_STRIP_QUOTES = str.maketrans('', '', '"\'')
+
 # ---------------- Helper Functions ----------------
 
 def check_directory_exists(folder):
@@ -18,16 +31,18 @@ def check_directory_exists(folder):
 
 def read_existing_settings(filename):
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # orjson's decode error subclasses json.JSONDecodeError, so the caller's handler still applies
+        return _json_loads(Path(filename).read_bytes())
     except (IOError, OSError) as e:
         print(f"Error reading settings file: {e}")
         raise
 
 def write_settings(filename, data):
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        # Write to a temp file and swap it in so an interrupted write never leaves truncated JSON
+        tmp_file = filename + '.tmp'
+        Path(tmp_file).write_bytes(_json_dumps(data))
+        os.replace(tmp_file, filename)
     except (IOError, OSError) as e:
         print(f"Error writing settings file: {e}")
         raise
@@ -53,12 +68,34 @@ def prompt_user_for_number(prompt_message, default_value, data_key, data_type=in
         except ValueError:
             print("User input is not a valid number")
 
+def prompt_yes_no(prompt_message, default_value):
+    """Ask a yes/no question until the answer is valid; returns True for yes."""
+    while True:
+        answer = (input(prompt_message) or default_value).lower()
+        if answer in _YES:
+            return True
+        if answer in _NO:
+            return False
+        print("Invalid choice. Please enter either yes or no")
+
+def prompt_path(prompt_message, default_value):
+    """Ask for a directory, optionally testing and re-entering it; returns it with a trailing slash."""
+    path = input(prompt_message).translate(_STRIP_QUOTES) or default_value
+    while prompt_yes_no('\nDo you want to test the given path? [y/N]  ', 'no'):
+        if os.path.exists(path):
+            print('The path appears to be valid. Settings saved.')
+            break
+        print('The path appears to be invalid.')
+        if not prompt_yes_no('\nDo you want to edit the path? [y/N]  ', 'no'):
+            break
+        path = input(prompt_message).translate(_STRIP_QUOTES) or default_value
+    # Ensure trailing slash for consistency
+    if not path.endswith('/'):
+        path = path + '/'
+    return path
+
 def is_valid_plex_url(url):
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except ValueError:
-        return False
+    return bool(url) and _PLEX_URL_RE.match(url) is not None
 
 # Helper to compute a common root for a list of paths
 def find_common_root(paths):
@@ -66,23 +103,18 @@ def find_common_root(paths):
     if not paths:
         return "/"
 
-    # Normalize trailing slashes and split
-    normed = [p.rstrip('/') for p in paths]
-    split_paths = [p.split('/') for p in normed]
-
-    common_parts = []
-    for parts in zip(*split_paths):
-        if all(part == parts[0] for part in parts):
-            common_parts.append(parts[0])
-        else:
-            break
-
-    # Handle leading empty string (absolute paths)
-    if common_parts and common_parts[0] == '':
-        if len(common_parts) == 1:
-            return '/'
-        return "/" + "/".join(common_parts[1:])
-    return "/" + "/".join(common_parts) if common_parts else "/"
+    # Normalize trailing slashes, keeping a bare "/" intact
+    normed = [p.rstrip('/') or '/' for p in paths]
+    # Libraries usually share one base path; then it is the answer without running commonpath
+    first = normed[0]
+    if first.startswith('/') and all(p == first for p in normed):
+        return first
+    try:
+        common = posixpath.commonpath(normed)
+    except ValueError:
+        # Absolute and relative paths share no common root
+        return "/"
+    return common if common.startswith('/') else "/" + common
 
 
 def is_unraid():
@@ -185,32 +217,19 @@ def setup():
 
         # Offer auto-detection on Unraid
         if is_unraid():
-            while True:
-                auto_detect = input('\nWould you like to auto-detect your Plex token? [Y/n] ') or 'yes'
-                if auto_detect.lower() in ['y', 'yes']:
-                    detected_token, plex_path = auto_detect_plex_token()
-                    if detected_token:
-                        # Show partial token for security (first 8 and last 4 chars)
-                        if len(detected_token) > 12:
-                            masked_token = detected_token[:8] + '...' + detected_token[-4:]
-                        else:
-                            masked_token = detected_token[:4] + '...'
-                        print(f"Token found: {masked_token}")
-                        while True:
-                            use_token = input(f'Use this token? [Y/n] ') or 'yes'
-                            if use_token.lower() in ['y', 'yes']:
-                                token = detected_token
-                                break
-                            elif use_token.lower() in ['n', 'no']:
-                                print("Token not used. Please enter manually.")
-                                break
-                            else:
-                                print("Invalid choice. Please enter either yes or no")
-                    break
-                elif auto_detect.lower() in ['n', 'no']:
-                    break
-                else:
-                    print("Invalid choice. Please enter either yes or no")
+            if prompt_yes_no('\nWould you like to auto-detect your Plex token? [Y/n] ', 'yes'):
+                detected_token, plex_path = auto_detect_plex_token()
+                if detected_token:
+                    # Show partial token for security (first 8 and last 4 chars)
+                    if len(detected_token) > 12:
+                        masked_token = detected_token[:8] + '...' + detected_token[-4:]
+                    else:
+                        masked_token = detected_token[:4] + '...'
+                    print(f"Token found: {masked_token}")
+                    if prompt_yes_no('Use this token? [Y/n] ', 'yes'):
+                        token = detected_token
+                    else:
+                        print("Token not used. Please enter manually.")
 
         # Manual entry if no token yet
         if not token:
@@ -221,7 +240,9 @@ def setup():
             continue
         try:
             plex = PlexServer(settings_data['PLEX_URL'], token)
-            user = plex.myPlexAccount().username
+            # Fetched once; the user list below comes from the same account
+            account = plex.myPlexAccount()
+            user = account.username
             print(f"Connection successful! Currently connected as {user}")
             libraries = plex.library.sections()
             settings_data['PLEX_TOKEN'] = token
@@ -230,18 +251,20 @@ def setup():
             print(f"Plex is running on {operating_system}")
 
             valid_sections = []
+            # Keys already chosen, for O(1) duplicate checks
+            seen_sections = set()
             selected_libraries = []
-            plex_library_folders = []
 
             # Step 1: Collect library selections from user
             while not valid_sections:
                 for library in libraries:
                     print(f"\nYour plex library name: {library.title}")
-                    include = input("Do you want to include this library? [Y/n]  ") or 'yes'
-                    if include.lower() in ['n', 'no']:
+                    include = (input("Do you want to include this library? [Y/n]  ") or 'yes').lower()
+                    if include in _NO:
                         continue
-                    elif include.lower() in ['y', 'yes']:
-                        if library.key not in valid_sections:
+                    elif include in _YES:
+                        if library.key not in seen_sections:
+                            seen_sections.add(library.key)
                             valid_sections.append(library.key)
                             selected_libraries.append(library)
                     else:
@@ -293,15 +316,21 @@ def setup():
                 print(f"\nPlex source path set to: {plex_source}")
                 settings_data['plex_source'] = plex_source
 
-            # Step 3: Compute relative library folders from selected libraries
+            # Step 3: Compute relative library folders from selected libraries, deduplicated in order
+            plex_library_folders = {}
+            plex_source = settings_data['plex_source']
+            prefix = plex_source.rstrip('/') + '/'
             for lib in selected_libraries:
                 for location in lib.locations:
-                    rel = os.path.relpath(location, settings_data['plex_source']).strip('/')
-                    rel = rel.replace('\\', '/')
-                    if rel not in plex_library_folders:
-                        plex_library_folders.append(rel)
+                    # Locations normally sit under plex_source, so a prefix strip avoids relpath's normalisation
+                    if location.startswith(prefix):
+                        rel = location.removeprefix(prefix)
+                    else:
+                        rel = os.path.relpath(location, plex_source)
+                    rel = rel.replace('\\', '/').strip('/')
+                    plex_library_folders[rel] = None
 
-            settings_data['plex_library_folders'] = plex_library_folders
+            settings_data['plex_library_folders'] = list(plex_library_folders)
 
 
         except (BadRequest, requests.exceptions.RequestException) as e:
@@ -319,40 +348,33 @@ def setup():
         prompt_user_for_number('\nMaximum age of the media onDeck to be fetched? (default: 99) ', '99', 'days_to_monitor')
 
     # ----------------Primary User Watchlist Settings ----------------
-    while 'watchlist_toggle' not in settings_data:
-        watchlist = input('\nDo you want to fetch your own watchlist media? [y/N] ') or 'no'
-        if watchlist.lower() in ['n', 'no']:
-            settings_data['watchlist_toggle'] = False
-            settings_data['watchlist_episodes'] = 0
-            settings_data['watchlist_cache_expiry'] = 1
-        elif watchlist.lower() in ['y', 'yes']:
+    if 'watchlist_toggle' not in settings_data:
+        if prompt_yes_no('\nDo you want to fetch your own watchlist media? [y/N] ', 'no'):
             settings_data['watchlist_toggle'] = True
             prompt_user_for_number('\nHow many episodes do you want fetch from your Watchlist? (default: 3) ', '3', 'watchlist_episodes')
             prompt_user_for_number('\nDefine the watchlist cache expiry duration in hours (default: 6) ', '6', 'watchlist_cache_expiry')
         else:
-            print("Invalid choice. Please enter either yes or no")
+            settings_data['watchlist_toggle'] = False
+            settings_data['watchlist_episodes'] = 0
+            settings_data['watchlist_cache_expiry'] = 1
 
     # ---------------- Users / Skip Lists ----------------
-    while 'users_toggle' not in settings_data:
+    if 'users_toggle' not in settings_data:
         skip_ondeck = []
         skip_watchlist = []
 
-        fetch_all_users = input('\nDo you want to fetch onDeck media from other users?  [Y/n] ') or 'yes'
-        if fetch_all_users.lower() not in ['y', 'yes', 'n', 'no']:
-            print("Invalid choice. Please enter either yes or no")
-            continue
-
-        if fetch_all_users.lower() in ['y', 'yes']:
+        if prompt_yes_no('\nDo you want to fetch onDeck media from other users?  [Y/n] ', 'yes'):
             settings_data['users_toggle'] = True
 
             # Build the full user list (local + remote)
             user_entries = []
-            for user in plex.myPlexAccount().users():
+            machine_identifier = plex.machineIdentifier
+            for user in account.users():
                 name = user.title
                 username = getattr(user, "username", None)
                 is_local = username is None
                 try:
-                    token = user.get_token(plex.machineIdentifier)
+                    token = user.get_token(machine_identifier)
                 except Exception as e:
                     print(f"\nSkipping user '{name}' (error getting token: {e})")
                     continue
@@ -371,34 +393,17 @@ def setup():
 
             settings_data["users"] = user_entries
 
-            # --- Skip OnDeck ---
-            skip_users_choice = input('\nWould you like to skip onDeck for some of the users? [y/N] ') or 'no'
-            if skip_users_choice.lower() in ['y', 'yes']:
-                for u in settings_data["users"]:
-                    while True:
-                        answer_ondeck = input(f'\nDo you want to skip onDeck for this user? {u["title"]} [y/N] ') or 'no'
-                        if answer_ondeck.lower() not in ['y', 'yes', 'n', 'no']:
-                            print("Invalid choice. Please enter either yes or no")
-                            continue
-                        if answer_ondeck.lower() in ['y', 'yes']:
-                            u["skip_ondeck"] = True
-                        break
-
-            # --- Skip Watchlist (local users only) ---
+            # --- Skip OnDeck / Skip Watchlist (local users only), asked per user in one pass ---
+            # The skip lists are filled in the same pass as the per-user answers
+            ask_skip_ondeck = prompt_yes_no('\nWould you like to skip onDeck for some of the users? [y/N] ', 'no')
             for u in settings_data["users"]:
-                if u["is_local"]:
-                    while True:
-                        answer_watchlist = input(f'\nDo you want to skip watchlist for this local user? {u["title"]} [y/N] ') or 'no'
-                        if answer_watchlist.lower() not in ['y', 'yes', 'n', 'no']:
-                            print("Invalid choice. Please enter either yes or no")
-                            continue
-                        if answer_watchlist.lower() in ['y', 'yes']:
-                            u["skip_watchlist"] = True
-                        break
-
-            # Build final skip lists
-            skip_ondeck = [u["token"] for u in settings_data["users"] if u["skip_ondeck"]]
-            skip_watchlist = [u["token"] for u in settings_data["users"] if u["is_local"] and u["skip_watchlist"]]
+                if ask_skip_ondeck and prompt_yes_no(f'\nDo you want to skip onDeck for this user? {u["title"]} [y/N] ', 'no'):
+                    u["skip_ondeck"] = True
+                    skip_ondeck.append(u["token"])
+
+                if u["is_local"] and prompt_yes_no(f'\nDo you want to skip watchlist for this local user? {u["title"]} [y/N] ', 'no'):
+                    u["skip_watchlist"] = True
+                    skip_watchlist.append(u["token"])
 
             settings_data["skip_ondeck"] = skip_ondeck
             settings_data["skip_watchlist"] = skip_watchlist
@@ -409,112 +414,69 @@ def setup():
             settings_data["skip_watchlist"] = []
 
     # ---------------- Remote Watchlist RSS ----------------
-    while 'remote_watchlist_toggle' not in settings_data:
-        remote_watchlist = input('\nWould you like to fetch Watchlist media from ALL remote Plex users? [y/N] ') or 'no'
-        if remote_watchlist.lower() in ['n', 'no']:
-            settings_data['remote_watchlist_toggle'] = False
-        elif remote_watchlist.lower() in ['y', 'yes']:
+    if 'remote_watchlist_toggle' not in settings_data:
+        if prompt_yes_no('\nWould you like to fetch Watchlist media from ALL remote Plex users? [y/N] ', 'no'):
             settings_data['remote_watchlist_toggle'] = True
-            while True:
-                rss_url = input('\nGo to https://app.plex.tv/desktop/#!/settings/watchlist and activate the Friends\' Watchlist.\nEnter the generated URL here: ').strip()
-                if not rss_url:
-                    print("URL is not valid. It cannot be empty.")
-                    continue
-                try:
-                    response = requests.get(rss_url, timeout=10)
-                    if response.status_code == 200 and b'<Error' not in response.content:
-                        print("RSS feed URL validated successfully.")
-                        settings_data['remote_watchlist_rss_url'] = rss_url
-                        break
-                    else:
-                        print("Invalid RSS feed URL or feed not accessible. Please check and try again.")
-                except requests.RequestException as e:
-                    print(f"Error accessing the URL: {e}")
+            # One session so retries reuse the connection to the feed host
+            with requests.Session() as session:
+                while True:
+                    rss_url = input('\nGo to https://app.plex.tv/desktop/#!/settings/watchlist and activate the Friends\' Watchlist.\nEnter the generated URL here: ').strip()
+                    if not rss_url:
+                        print("URL is not valid. It cannot be empty.")
+                        continue
+                    try:
+                        # Only the start of the feed is needed to spot an <Error> document, so stream it
+                        with session.get(rss_url, timeout=10, stream=True) as response:
+                            head = next(response.iter_content(1024), b'')
+                        if response.status_code == 200 and b'<Error' not in head:
+                            print("RSS feed URL validated successfully.")
+                            settings_data['remote_watchlist_rss_url'] = rss_url
+                            break
+                        else:
+                            print("Invalid RSS feed URL or feed not accessible. Please check and try again.")
+                    except requests.RequestException as e:
+                        print(f"Error accessing the URL: {e}")
         else:
-            print("Invalid choice. Please enter either yes or no")
+            settings_data['remote_watchlist_toggle'] = False
 
     # ---------------- Watched Move ----------------
-    while 'watched_move' not in settings_data:
-        watched_move = input('\nDo you want to move watched media from the cache back to the array? [y/N] ') or 'no'
-        if watched_move.lower() in ['n', 'no']:
-            settings_data['watched_move'] = False
-            settings_data['watched_cache_expiry'] = 48
-        elif watched_move.lower() in ['y', 'yes']:
+    if 'watched_move' not in settings_data:
+        if prompt_yes_no('\nDo you want to move watched media from the cache back to the array? [y/N] ', 'no'):
             settings_data['watched_move'] = True
             prompt_user_for_number('\nDefine the watched cache expiry duration in hours (default: 48) ', '48', 'watched_cache_expiry')
         else:
-            print("Invalid choice. Please enter either yes or no")
+            settings_data['watched_move'] = False
+            settings_data['watched_cache_expiry'] = 48
 
     # ---------------- Cache / Array Paths ----------------
     if 'cache_dir' not in settings_data:
-        cache_dir = input('\nInsert the path of your cache drive: (default: "/mnt/cache") ').replace('"', '').replace("'", '') or '/mnt/cache'
-        while True:
-            test_path = input('\nDo you want to test the given path? [y/N]  ') or 'no'
-            if test_path.lower() in ['y', 'yes']:
-                if os.path.exists(cache_dir):
-                    print('The path appears to be valid. Settings saved.')
-                    break
-                else:
-                    print('The path appears to be invalid.')
-                    edit_path = input('\nDo you want to edit the path? [y/N]  ') or 'no'
-                    if edit_path.lower() in ['y', 'yes']:
-                        cache_dir = input('\nInsert the path of your cache drive: (default: "/mnt/cache") ').replace('"', '').replace("'", '') or '/mnt/cache'
-                    elif edit_path.lower() in ['n', 'no']:
-                        break
-                    else:
-                        print("Invalid choice. Please enter either yes or no")
-            elif test_path.lower() in ['n', 'no']:
-                break
-            else:
-                print("Invalid choice. Please enter either yes or no")
-        # Ensure trailing slash for consistency
-        if not cache_dir.endswith('/'):
-            cache_dir = cache_dir + '/'
-        settings_data['cache_dir'] = cache_dir
+        settings_data['cache_dir'] = prompt_path('\nInsert the path of your cache drive: (default: "/mnt/cache") ', '/mnt/cache')
 
     if 'real_source' not in settings_data:
-        real_source = input('\nInsert the path where your media folders are located?: (default: "/mnt/user") ').replace('"', '').replace("'", '') or '/mnt/user'
-        while True:
-            test_path = input('\nDo you want to test the given path? [y/N]  ') or 'no'
-            if test_path.lower() in ['y', 'yes']:
-                if os.path.exists(real_source):
-                    print('The path appears to be valid. Settings saved.')
-                    break
-                else:
-                    print('The path appears to be invalid.')
-                    edit_path = input('\nDo you want to edit the path? [y/N]  ') or 'no'
-                    if edit_path.lower() in ['y', 'yes']:
-                        real_source = input('\nInsert the path where your media folders are located?: (default: "/mnt/user") ').replace('"', '').replace("'", '') or '/mnt/user'
-                    elif edit_path.lower() in ['n', 'no']:
-                        break
-                    else:
-                        print("Invalid choice. Please enter either yes or no")
-            elif test_path.lower() in ['n', 'no']:
-                break
-            else:
-                print("Invalid choice. Please enter either yes or no")
-        # Ensure trailing slash for consistency
-        if not real_source.endswith('/'):
-            real_source = real_source + '/'
+        real_source = prompt_path('\nInsert the path where your media folders are located?: (default: "/mnt/user") ', '/mnt/user')
         settings_data['real_source'] = real_source
 
-        num_folders = len(settings_data['plex_library_folders'])
-        nas_library_folder = []
-        for i in range(num_folders):
-            folder_name = input(f"\nEnter the corresponding NAS/Unraid library folder for the Plex mapped folder: (Default is the same as plex) '{settings_data['plex_library_folders'][i]}' ") or settings_data['plex_library_folders'][i]
-            folder_name = folder_name.replace(real_source, '').strip('/')
-            nas_library_folder.append(folder_name)
-        settings_data['nas_library_folders'] = nas_library_folder
+        plex_library_folders = settings_data['plex_library_folders']
+        # Same root on both sides means the folders map one-to-one, so there is nothing to ask
+        if real_source.rstrip('/') == settings_data['plex_source'].rstrip('/'):
+            settings_data['nas_library_folders'] = list(plex_library_folders)
+        else:
+            print("\nPlex mapped library folders:")
+            for folder in plex_library_folders:
+                print(f"  {folder}")
+            if prompt_yes_no('\nAre any of the NAS/Unraid library folders named differently? [y/N] ', 'no'):
+                nas_library_folder = []
+                for folder in plex_library_folders:
+                    folder_name = input(f"\nEnter the corresponding NAS/Unraid library folder for the Plex mapped folder: (Default is the same as plex) '{folder}' ") or folder
+                    folder_name = folder_name.replace(real_source, '').strip('/')
+                    nas_library_folder.append(folder_name)
+                settings_data['nas_library_folders'] = nas_library_folder
+            else:
+                settings_data['nas_library_folders'] = list(plex_library_folders)
 
     # ---------------- Active Session ----------------
-    while 'exit_if_active_session' not in settings_data:
-        session = input('\nIf there is an active session in plex, do you want to exit the script (Yes) or just skip the playing media (No)? [y/N] ') or 'no'
-        if session.lower() in ['n', 'no']:
-            settings_data['exit_if_active_session'] = False
-        elif session.lower() in ['y', 'yes']:
-            settings_data['exit_if_active_session'] = True
-        else:
-            print("Invalid choice. Please enter either yes or no")
+    if 'exit_if_active_session' not in settings_data:
+        settings_data['exit_if_active_session'] = prompt_yes_no('\nIf there is an active session in plex, do you want to exit the script (Yes) or just skip the playing media (No)? [y/N] ', 'no')
 
     # ---------------- Concurrent Moves ----------------
     if 'max_concurrent_moves_cache' not in settings_data:
@@ -524,14 +486,8 @@ def setup():
         prompt_user_for_number('\nHow many files do you want to move from the cache to the array at the same time? (default: 2) ', '2', 'max_concurrent_moves_array')
 
     # ---------------- Debug ----------------
-    while 'debug' not in settings_data:
-        debug = input('\nDo you want to debug the script? No data will actually be moved. [y/N] ') or 'no'
-        if debug.lower() in ['n', 'no']:
-            settings_data['debug'] = False
-        elif debug.lower() in ['y', 'yes']:
-            settings_data['debug'] = True
-        else:
-            print("Invalid choice. Please enter either yes or no")
+    if 'debug' not in settings_data:
+        settings_data['debug'] = prompt_yes_no('\nDo you want to debug the script? No data will actually be moved. [y/N] ', 'no')
 
     write_settings(settings_filename, settings_data)
     print("Setup complete! You can now run the plexcache.py script.\n")
@@ -556,14 +512,9 @@ if os.path.exists(settings_filename):
         setup()
 else:
     print(f"Settings file {settings_filename} doesn't exist, please check the path:\n")
-    while True:
-        creation = input("\nIf the path is correct, do you want to create the file? [Y/n] ") or 'yes'
-        if creation.lower() in ['y', 'yes']:
-            print("Starting setup...\n")
-            settings_data = {}
-            setup()
-            break
-        elif creation.lower() in ['n', 'no']:
-            exit("Exiting as requested, setting file not created.")
-        else:
-            print("Invalid choice. Please enter either 'yes' or 'no'")
+    if prompt_yes_no("\nIf the path is correct, do you want to create the file? [Y/n] ", 'yes'):
+        print("Starting setup...\n")
+        settings_data = {}
+        setup()
+    else:
+        exit("Exiting as requested, setting file not created.")
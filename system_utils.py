@@ -13,6 +13,9 @@ import posixpath
 from typing import Tuple, Optional
 import logging
 
+# Windows drive letter prefix, e.g. "C:"
+_DRIVE_LETTER_RE = re.compile(r'^[A-Za-z]:')
+
 
 class SystemDetector:
     """Detects and provides information about the current system."""
@@ -22,6 +25,8 @@ class SystemDetector:
         self.is_linux = self.os_name != 'Windows'
         self.is_unraid = self._detect_unraid()
         self.is_docker = self._detect_docker()
+        # Result of the connectivity probe, checked once per run
+        self._connected: Optional[bool] = None
         
     def _detect_unraid(self) -> bool:
         """Detect if running on Unraid system."""
@@ -52,11 +57,13 @@ class SystemDetector:
     
     def is_connected(self) -> bool:
         """Check if internet connection is available."""
-        try:
-            socket.gethostbyname("www.google.com")
-            return True
-        except socket.error:
-            return False
+        if self._connected is None:
+            try:
+                socket.gethostbyname("www.google.com")
+                self._connected = True
+            except socket.error:
+                self._connected = False
+        return self._connected
 
 
 class PathConverter:
@@ -109,12 +116,13 @@ class PathConverter:
     def convert_path_to_posix(self, value: str) -> Tuple[str, Optional[str]]:
         """Convert path to POSIX format."""
         try:
-            # Save the drive letter if exists
-            drive_letter_match = re.search(r'^[A-Za-z]:', value)
-            drive_letter = drive_letter_match.group() + '\\' if drive_letter_match else None
-            
-            # Remove drive letter if exists
-            value = re.sub(r'^[A-Za-z]:', '', value)
+            # Save and strip the drive letter if it exists, matching the prefix only once
+            drive_letter_match = _DRIVE_LETTER_RE.match(value)
+            if drive_letter_match:
+                drive_letter = drive_letter_match.group() + '\\'
+                value = value[drive_letter_match.end():]
+            else:
+                drive_letter = None
             value = value.replace(ntpath.sep, posixpath.sep)
             return posixpath.normpath(value), drive_letter
         except Exception as e:
@@ -162,21 +170,20 @@ class FileUtils:
         
         logging.debug(f"Path validation successful: {path}")
     
-    def get_free_space(self, directory: str) -> Tuple[float, str]:
-        """Get free space in a human-readable format."""
-        if not os.path.exists(directory):
+    def get_free_space(self, directory: str) -> int:
+        """Get free space in bytes."""
+        # statvfs reports a missing path itself, so no separate exists() check is needed
+        try:
+            stat = os.statvfs(directory)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Invalid path, unable to calculate free space for: {directory}.")
-        
-        stat = os.statvfs(directory)
-        free_space_bytes = stat.f_bfree * stat.f_frsize
-        return self._convert_bytes_to_readable_size(free_space_bytes)
+        return stat.f_bfree * stat.f_frsize
     
-    def get_total_size_of_files(self, files: list) -> Tuple[float, str]:
-        """Calculate total size of files in human-readable format."""
-        total_size_bytes = sum(os.path.getsize(file) for file in files)
-        return self._convert_bytes_to_readable_size(total_size_bytes)
+    def get_total_size_of_files(self, files: list) -> int:
+        """Calculate total size of files in bytes."""
+        return sum(os.path.getsize(file) for file in files)
     
-    def _convert_bytes_to_readable_size(self, size_bytes: int) -> Tuple[float, str]:
+    def convert_bytes_to_readable_size(self, size_bytes: int) -> Tuple[float, str]:
         """Convert bytes to human-readable format."""
         if size_bytes >= (1024 ** 4):
             size = size_bytes / (1024 ** 4)